@@ -1,7 +1,8 @@
 from flask import Flask, jsonify, testing
-from flasgger import Swagger
-from app.utils.extensions import db, migrate
+from app.utils.extensions import db, migrate, ticket_cache, count_cache, event_cache, metrics, read_replica
 from app.config import Config, DevelopmentConfig, TestingConfig
+from app.utils.engine import apply_engine_profile, configure_engines
+from app.utils.docs import init_docs
 
 
 def create_app(config_class=None):
@@ -14,57 +15,34 @@ def create_app(config_class=None):
 
     app.config.from_object(config_class)
 
+    # Tune the database engine for the configured backend
+    apply_engine_profile(app)
+
     # Initialize extensions
     db.init_app(app)
+    configure_engines(app, db)
     migrate.init_app(app, db)
+    ticket_cache.init_app(app)
+    count_cache.init_app(app)
+    event_cache.init_app(app)
+    metrics.init_app(app, db)
+    read_replica.init_app(app, db)
 
-    # Initialize Swagger
-    swagger_template = {
-        "swagger": "2.0",
-        "info": {
-            "title": "TicketQ API",
-            "description": "Simple Ticket Management API",
-            "version": "1.0.0",
-            "contact": {
-                "name": "TicketQ API Support",
-                # "email": "support@ticketq.com"
-            }
-        },
-        "basePath": "/",
-        "schemes": ["http"],
-        "consumes": ["application/json"],
-        "produces": ["application/json"],
-        "tags": [
-            {
-                "name": "Tickets",
-                "description": "Ticket management operations"
-            }
-        ]
-    }
-
-    swagger_config = {
-        "headers": [],
-        "specs": [
-            {
-                "endpoint": 'apispec_1',
-                "route": '/apispec_1.json',
-                "rule_filter": lambda rule: True,
-                "model_filter": lambda tag: True,
-            }
-        ],
-        "static_url_path": "/flasgger_static",
-        "swagger_ui": True,
-        "specs_route": "/apidocs/"
-    }
-
-    swagger = Swagger(app, config=swagger_config, template=swagger_template)
+    # Initialize Swagger (Flasgger is only imported when enabled)
+    init_docs(app)
 
     # Import models to ensure they are registered with SQLAlchemy
     from app.models import Ticket
 
     # Register blueprints
     from app.routes.ticket_routes import tickets_bp
+    from app.routes.event_routes import events_bp
     app.register_blueprint(tickets_bp)
+    app.register_blueprint(events_bp)
+
+    # Register CLI commands
+    from app.cli import register_commands
+    register_commands(app)
 
     # Health check endpoint
     @app.route('/')
@@ -76,7 +54,10 @@ def create_app(config_class=None):
             'documentation': '/apidocs/',
             'endpoints': {
                 'tickets': '/tickets',
+                'ticket_changes': '/tickets/changes?since=<token>',
+                'event_stats': '/events/<event_name>/stats',
                 'health': '/',
+                'metrics': '/metrics',
                 'api_docs': '/apidocs/'
             },
             'database': 'SQLite',
@@ -100,6 +81,11 @@ def create_app(config_class=None):
         return jsonify({
             'status': 'healthy',
             # 'timestamp': '2025-08-01T00:00:00Z'
+            'cache': {
+                'tickets': ticket_cache.stats(),
+                'counts': count_cache.stats(),
+                'events': event_cache.stats()
+            }
         })
 
     # Error handlers
@@ -127,5 +113,9 @@ def create_app(config_class=None):
     return app
 
 
-# For backward compatibility
-app = create_app()
+def __getattr__(name):
+    """Build the module-level `app` on first access, for backward compatibility"""
+    if name == 'app':
+        instance = globals()['app'] = create_app()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,175 @@
+import itertools
+import sys
+from datetime import datetime, timedelta
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+from sqlalchemy import tuple_
+
+
+def _hot_queries():
+    """Unfiltered hot read paths in TicketService; these must not sort"""
+    from app.models.event import Event
+    from app.models.ticket import Ticket
+    from app.services.ticket_service import TicketService
+
+    now = datetime.utcnow()
+    return {
+        'list newest first (page mode)': TicketService.build_list_statement()
+            .limit(10).offset(0),
+        'list newest first (cursor mode)': TicketService.build_list_statement()
+            .where(tuple_(Ticket.created_at, Ticket.id) < tuple_(now, 1000))
+            .limit(11),
+        'tickets for an event by time': TicketService.select_rows()
+            .where(Event.name == 'Rock Concert 2025')
+            .order_by(Event.time),
+        'search: tickets of one matching event': TicketService.select_rows()
+            .where(Ticket.event_id == 1,
+                   tuple_(Ticket.created_at, Ticket.id) > tuple_(now, 1000))
+            .order_by(Ticket.created_at, Ticket.id)
+            .limit(11),
+        'change feed': TicketService.select_rows()
+            .where(tuple_(Ticket.change_seq, Ticket.id) > tuple_(1000, 1))
+            .order_by(Ticket.change_seq, Ticket.id)
+            .limit(1001),
+    }
+
+
+def _filter_queries():
+    """Every combination of the GET /tickets filters; these must not full-scan"""
+    from app.services.ticket_service import TicketService
+
+    now = datetime.utcnow()
+    values = {
+        'event_name': {'event_name': 'Rock Concert 2025'},
+        'location': {'location': 'Jakarta Convention Center'},
+        'time range': {'time_from': now, 'time_to': now + timedelta(days=1)},
+        'is_used=false': {'is_used': False},
+    }
+    statements = {'is_used=true': TicketService.build_list_statement({'is_used': True}).limit(10)}
+    for size in range(1, len(values) + 1):
+        for combo in itertools.combinations(values, size):
+            filters = {}
+            for name in combo:
+                filters.update(values[name])
+            statements[' + '.join(combo)] = TicketService.build_list_statement(filters).limit(10)
+    return statements
+
+
+@click.command('check-indexes')
+@with_appcontext
+def check_indexes_command():
+    """Verify that the hot ticket queries are served by an index"""
+    from app.utils.query_plans import check_statements
+
+    # Page mode has no WHERE clause: walking the listing index in order and
+    # stopping at the LIMIT is the best plan there is
+    report = check_statements(_hot_queries(), ordered_scans={
+        'list newest first (page mode)': 'ix_tickets_created_at_id'
+    })
+    report.update(check_statements(_filter_queries(), allow_sort=True))
+    failed = False
+    for name, result in report.items():
+        status = 'FAIL' if result['problems'] else 'ok'
+        failed = failed or bool(result['problems'])
+        click.echo(f"[{status}] {name}")
+        for step in result['plan']:
+            click.echo(f"    {step}")
+
+    if failed:
+        click.echo('Some hot queries are not index-backed. '
+                   'On PostgreSQL, run ANALYZE on a representative dataset first.')
+        sys.exit(1)
+
+
+@click.command('build-apispec')
+@click.option('--output', '-o', default=None,
+              help='Destination file (default: SWAGGER_SPEC_FILE)')
+@with_appcontext
+def build_apispec_command(output):
+    """Compile the Swagger spec to JSON so workers can serve it without Flasgger parsing YAML"""
+    from app.utils.docs import compile_spec
+
+    output = output or current_app.config.get('SWAGGER_SPEC_FILE')
+    if not output:
+        click.echo('Pass --output or set SWAGGER_SPEC_FILE.')
+        sys.exit(1)
+    if not hasattr(current_app, 'swag'):
+        click.echo('Swagger is disabled; set SWAGGER_ENABLED=1 to build the spec.')
+        sys.exit(1)
+
+    body = compile_spec(current_app)
+    with open(output, 'wb') as f:
+        f.write(body)
+    click.echo(f"Wrote {len(body)} bytes to {output}")
+
+
+@click.command('purge-idempotency-keys')
+@click.option('--ttl', type=int, default=None,
+              help='Age in seconds after which keys are removed (default: IDEMPOTENCY_TTL)')
+@with_appcontext
+def purge_idempotency_keys_command(ttl):
+    """Delete stored Idempotency-Key responses older than the TTL"""
+    from app.services.idempotency_service import IdempotencyService
+
+    removed = IdempotencyService.purge_expired(ttl)
+    click.echo(f"Removed {removed} idempotency keys")
+
+
+@click.command('archive-tickets')
+@click.option('--older-than-days', type=int, default=None,
+              help='Archive tickets whose event ended this many days ago '
+                   '(default: TICKET_ARCHIVE_AFTER_DAYS)')
+@click.option('--chunk-size', type=int, default=None,
+              help='Tickets moved per transaction (default: TICKET_ARCHIVE_CHUNK_SIZE)')
+@click.option('--max-chunks', type=int, default=None,
+              help='Stop after this many chunks (default: until done)')
+@with_appcontext
+def archive_tickets_command(older_than_days, chunk_size, max_chunks):
+    """Move tickets for past events from tickets to tickets_archive"""
+    from app.services.ticket_service import TicketService
+
+    config = current_app.config
+    if older_than_days is None:
+        older_than_days = config['TICKET_ARCHIVE_AFTER_DAYS']
+    before = datetime.now() - timedelta(days=older_than_days)
+    moved = TicketService.archive_past_tickets(
+        before,
+        chunk_size=chunk_size or config['TICKET_ARCHIVE_CHUNK_SIZE'],
+        max_chunks=max_chunks
+    )
+    click.echo(f"Archived {moved} tickets for events before {before.isoformat()}")
+
+
+@click.command('rebuild-event-stats')
+@with_appcontext
+def rebuild_event_stats_command():
+    """Recompute the event_stats table from tickets and tickets_archive"""
+    from app.services.event_stats_service import EventStatsService
+
+    events = EventStatsService.rebuild()
+    click.echo(f"Rebuilt stats for {events} events")
+
+
+@click.command('purge-ticket-tombstones')
+@click.option('--older-than-days', type=int, default=None,
+              help='Remove delete markers older than this (default: TICKET_TOMBSTONE_TTL_DAYS)')
+@with_appcontext
+def purge_ticket_tombstones_command(older_than_days):
+    """Delete old change-feed tombstones; older sync tokens then get 410"""
+    from app.services.ticket_service import TicketService
+
+    if older_than_days is None:
+        older_than_days = current_app.config['TICKET_TOMBSTONE_TTL_DAYS']
+    removed = TicketService.purge_tombstones(datetime.utcnow() - timedelta(days=older_than_days))
+    click.echo(f"Removed {removed} tombstones")
+
+
+def register_commands(app: Flask):
+    """Register custom CLI commands on the app"""
+    app.cli.add_command(check_indexes_command)
+    app.cli.add_command(build_apispec_command)
+    app.cli.add_command(purge_idempotency_keys_command)
+    app.cli.add_command(archive_tickets_command)
+    app.cli.add_command(rebuild_event_stats_command)
+    app.cli.add_command(purge_ticket_tombstones_command)
@@ -9,16 +9,103 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///tickets.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replica for GET /tickets routes (e.g. a copied SQLite file opened
+    # read-only: sqlite:///file:/path/replica.db?mode=ro&uri=true). Clients
+    # that wrote in the last READ_YOUR_WRITES_SECONDS keep reading the primary
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+    SQLALCHEMY_BINDS = {'replica': DATABASE_REPLICA_URL} if DATABASE_REPLICA_URL else {}
+    READ_REPLICA_BIND = 'replica'
+    READ_REPLICA_HEALTH_INTERVAL = float(os.environ.get('READ_REPLICA_HEALTH_INTERVAL', 5))
+    READ_YOUR_WRITES_SECONDS = int(os.environ.get('READ_YOUR_WRITES_SECONDS', 5))
+
+    # Engine profile: 'auto' picks 'sqlite' (WAL + pragmas) or 'server'
+    # (pooled connections) from the database URI; 'default' leaves
+    # SQLAlchemy's defaults untouched
+    DB_ENGINE_PROFILE = os.environ.get('DB_ENGINE_PROFILE') or 'auto'
+
+    # SQLite profile
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE') or 'WAL'
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS') or 'NORMAL'
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))
+    SQLITE_CACHE_SIZE = int(os.environ.get('SQLITE_CACHE_SIZE', -64000))  # negative = KiB
+
+    # Server profile (PostgreSQL etc.)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', '1') == '1'
+
     # API Configuration
     API_TITLE = os.environ.get('API_TITLE') or "TicketQ API"
     API_VERSION = os.environ.get('API_VERSION') or "1.0.0"
     API_DESCRIPTION = "Simple Ticket Management API"
 
+    # Bulk creation
+    TICKET_BATCH_MAX_SIZE = int(os.environ.get('TICKET_BATCH_MAX_SIZE', 50000))
+    TICKET_BATCH_CHUNK_SIZE = int(os.environ.get('TICKET_BATCH_CHUNK_SIZE', 1000))
+
+    # Batch redemption (gate scanners)
+    TICKET_REDEEM_MAX_SIZE = int(os.environ.get('TICKET_REDEEM_MAX_SIZE', 5000))
+
+    # In-process cache for GET /tickets/<id> (size 0 disables it)
+    TICKET_CACHE_SIZE = int(os.environ.get('TICKET_CACHE_SIZE', 10000))
+    TICKET_CACHE_TTL = float(os.environ.get('TICKET_CACHE_TTL', 30))
+
+    # Cached total counts for GET /tickets (writes adjust the cached value)
+    TICKET_COUNT_CACHE_SIZE = int(os.environ.get('TICKET_COUNT_CACHE_SIZE', 256))
+    TICKET_COUNT_CACHE_TTL = float(os.environ.get('TICKET_COUNT_CACHE_TTL', 5))
+
+    # Event lookups behind ticket creates and redeems (size 0 disables it)
+    EVENT_CACHE_SIZE = int(os.environ.get('EVENT_CACHE_SIZE', 10000))
+    EVENT_CACHE_TTL = float(os.environ.get('EVENT_CACHE_TTL', 300))
+
+    # Streaming export
+    TICKET_EXPORT_BATCH_SIZE = int(os.environ.get('TICKET_EXPORT_BATCH_SIZE', 1000))
+
+    # Hot/archive split: `flask archive-tickets` moves tickets whose event is
+    # older than this many days to tickets_archive, CHUNK_SIZE rows per commit
+    TICKET_ARCHIVE_AFTER_DAYS = int(os.environ.get('TICKET_ARCHIVE_AFTER_DAYS', 30))
+    TICKET_ARCHIVE_CHUNK_SIZE = int(os.environ.get('TICKET_ARCHIVE_CHUNK_SIZE', 1000))
+
+    # Change feed: `flask purge-ticket-tombstones` drops delete markers older
+    # than this; clients whose token predates them must do a full sync
+    TICKET_TOMBSTONE_TTL_DAYS = int(os.environ.get('TICKET_TOMBSTONE_TTL_DAYS', 30))
+
+    # Group commit (opt-in): single creates are queued to a background writer
+    # that commits them together every WINDOW_MS or MAX_ROWS, whichever comes
+    # first. Trades a few ms of latency for far fewer transactions under load
+    TICKET_GROUP_COMMIT = os.environ.get('TICKET_GROUP_COMMIT', '0') == '1'
+    TICKET_GROUP_COMMIT_WINDOW_MS = float(os.environ.get('TICKET_GROUP_COMMIT_WINDOW_MS', 5))
+    TICKET_GROUP_COMMIT_MAX_ROWS = int(os.environ.get('TICKET_GROUP_COMMIT_MAX_ROWS', 256))
+    TICKET_GROUP_COMMIT_TIMEOUT = float(os.environ.get('TICKET_GROUP_COMMIT_TIMEOUT', 10))
+
+    # Idempotency-Key on POST /tickets: stored responses live for
+    # IDEMPOTENCY_TTL seconds; a reservation whose request never finished is
+    # taken over after IDEMPOTENCY_LOCK_TIMEOUT; duplicates wait up to
+    # IDEMPOTENCY_WAIT_TIMEOUT for the first request before getting a 409
+    IDEMPOTENCY_TTL = int(os.environ.get('IDEMPOTENCY_TTL', 86400))
+    IDEMPOTENCY_LOCK_TIMEOUT = int(os.environ.get('IDEMPOTENCY_LOCK_TIMEOUT', 30))
+    IDEMPOTENCY_WAIT_TIMEOUT = float(os.environ.get('IDEMPOTENCY_WAIT_TIMEOUT', 10))
+    IDEMPOTENCY_PURGE_INTERVAL = int(os.environ.get('IDEMPOTENCY_PURGE_INTERVAL', 300))
+
+    # Per-request instrumentation (Server-Timing header and /metrics)
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') == '1'
+
+    # Swagger UI at /apidocs/ and the spec at /apispec_1.json. Off by default,
+    # so Flasgger is never imported unless SWAGGER_ENABLED=1
+    SWAGGER_ENABLED = os.environ.get('SWAGGER_ENABLED', '0') == '1'
+    # Precompiled spec from `flask build-apispec`; compiled on first request
+    # when unset or missing
+    SWAGGER_SPEC_FILE = os.environ.get('SWAGGER_SPEC_FILE')
+
     # Environment
     ENV = os.environ.get('ENV') or 'development'
 
 class DevelopmentConfig(Config):
     DEBUG = os.environ.get('FLASK_DEBUG', '1') == '1'
+    SWAGGER_ENABLED = os.environ.get('SWAGGER_ENABLED', '1') == '1'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///tickets_dev.db'
 
 class TestingConfig(Config):
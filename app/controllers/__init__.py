@@ -1,3 +1,4 @@
 from .ticket_controller import TicketController
+from .event_controller import EventController
 
-__all__ = ['TicketController']
+__all__ = ['TicketController', 'EventController']
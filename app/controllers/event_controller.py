@@ -0,0 +1,25 @@
+from flask import jsonify
+from app.services.event_stats_service import EventStatsService
+
+
+class EventController:
+    """Controller class for event endpoints"""
+
+    @staticmethod
+    def get_event_stats(event_name):
+        """Get ticket counters for an event"""
+        try:
+            stats = EventStatsService.get_event_stats(event_name)
+            if not stats:
+                return jsonify({
+                    'error': 'Not Found',
+                    'message': 'Event not found'
+                }), 404
+
+            return jsonify(stats.to_dict()), 200
+
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
@@ -1,51 +1,241 @@
-from flask import request, jsonify
+import csv
+import io
+import json
+from flask import request, jsonify, current_app, make_response, Response, stream_with_context
 from pydantic import ValidationError
-from app.services.ticket_service import TicketService
-from app.schemas.ticket_schemas import TicketCreateSchema, TicketUpdateSchema
+from app.services.ticket_service import TicketService, SyncTokenExpiredError
+from app.services.idempotency_service import IdempotencyService
+from app.utils.etag import ticket_etag
+from app.schemas.ticket_schemas import (
+    TicketCreateSchema,
+    TicketBatchCreateAdapter,
+    TicketUpdateSchema,
+    TicketRedeemSchema,
+    TicketFilterSchema,
+    TicketSearchSchema,
+    TicketChangesSchema
+)
 
 
 class TicketController:
     """Controller for ticket operations - Pure business logic"""
 
+    @staticmethod
+    def _validation_error(e: ValidationError):
+        """Convert Pydantic errors to a JSON-serializable 400 response"""
+        error_details = []
+        for error in e.errors():
+            error_details.append({
+                'field': error.get('loc', ['unknown'])[0] if error.get('loc') else 'unknown',
+                'message': error.get('msg', 'Validation error'),
+                'type': error.get('type', 'validation_error'),
+                'input': str(error.get('input', ''))
+            })
+
+        return jsonify({
+            'error': 'Validation Error',
+            'message': 'Invalid input data',
+            'details': error_details
+        }), 400
+
     @staticmethod
     def get_all_tickets():
         """Get all tickets with pagination"""
         try:
+            filters = TicketFilterSchema(**request.args.to_dict()).model_dump(exclude_none=True)
+
+            # Cursor mode: ?cursor=...&limit=... seeks on (created_at, id)
+            if 'cursor' in request.args or 'limit' in request.args:
+                cursor = request.args.get('cursor') or None
+                limit = request.args.get('limit', 10, type=int)
+                limit = max(1, min(limit, 100))
+
+                result = TicketService.get_tickets_by_cursor(
+                    cursor=cursor, limit=limit, filters=filters
+                )
+
+                return jsonify({
+                    'tickets': result['items'],
+                    'pagination': {
+                        'limit': result['limit'],
+                        'next_cursor': result['next_cursor'],
+                        'prev_cursor': result['prev_cursor'],
+                        'has_next': result['has_next'],
+                        'has_prev': result['has_prev']
+                    }
+                }), 200
+
             page = request.args.get('page', 1, type=int)
             per_page = request.args.get('per_page', 10, type=int)
+            include_total = request.args.get('include_total', 'true').lower() not in ('false', '0', 'no')
 
-            tickets_pagination = TicketService.get_all_tickets(page=page, per_page=per_page)
+            result = TicketService.get_ticket_page(
+                page=page, per_page=per_page, include_total=include_total, filters=filters
+            )
 
             return jsonify({
-                'tickets': [ticket.to_dict() for ticket in tickets_pagination.items],
+                'tickets': result['items'],
                 'pagination': {
-                    'page': tickets_pagination.page,
-                    'pages': tickets_pagination.pages,
-                    'per_page': tickets_pagination.per_page,
-                    'total': tickets_pagination.total,
-                    'has_next': tickets_pagination.has_next,
-                    'has_prev': tickets_pagination.has_prev
+                    'page': result['page'],
+                    'pages': result['pages'],
+                    'per_page': result['per_page'],
+                    'total': result['total'],
+                    'has_next': result['has_next'],
+                    'has_prev': result['has_prev']
                 }
             }), 200
 
+        except ValidationError as e:
+            return TicketController._validation_error(e)
+
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
         except Exception as e:
             return jsonify({
                 'error': 'Internal Server Error',
                 'message': str(e)
             }), 500
 
+    @staticmethod
+    def search_tickets():
+        """Full-text search over event names and locations"""
+        try:
+            search = TicketSearchSchema(**request.args.to_dict())
+
+            result = TicketService.search_tickets(
+                search.q, per_page=search.per_page, cursor=search.cursor
+            )
+
+            return jsonify({
+                'tickets': result['items'],
+                'pagination': {
+                    'per_page': result['per_page'],
+                    'next_cursor': result['next_cursor'],
+                    'has_next': result['has_next']
+                }
+            }), 200
+
+        except ValidationError as e:
+            return TicketController._validation_error(e)
+
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
+
+    @staticmethod
+    def get_ticket_changes():
+        """Tickets created, updated or deleted since a sync token"""
+        try:
+            params = TicketChangesSchema(**request.args.to_dict())
+
+            result = TicketService.get_ticket_changes(params.since, limit=params.limit)
+
+            return jsonify(result), 200
+
+        except ValidationError as e:
+            return TicketController._validation_error(e)
+
+        except SyncTokenExpiredError as e:
+            return jsonify({
+                'error': 'Gone',
+                'message': str(e)
+            }), 410
+
+        except ValueError as e:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': str(e)
+            }), 400
+
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
+
+    @staticmethod
+    def export_tickets():
+        """Stream all tickets as NDJSON or CSV"""
+        export_format = request.args.get('format', 'ndjson').lower()
+        if export_format not in ('ndjson', 'csv'):
+            return jsonify({
+                'error': 'Bad Request',
+                'message': "format must be 'ndjson' or 'csv'"
+            }), 400
+
+        try:
+            filters = TicketFilterSchema(**request.args.to_dict()).model_dump(exclude_none=True)
+        except ValidationError as e:
+            return TicketController._validation_error(e)
+
+        batches = TicketService.iter_ticket_dicts(
+            batch_size=current_app.config['TICKET_EXPORT_BATCH_SIZE'],
+            filters=filters
+        )
+
+        if export_format == 'ndjson':
+            def generate():
+                for batch in batches:
+                    yield ''.join(json.dumps(ticket) + '\n' for ticket in batch)
+            mimetype = 'application/x-ndjson'
+        else:
+            fields = ['id', 'eventName', 'location', 'time', 'isUsed', 'createdAt', 'updatedAt']
+
+            def generate():
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=fields)
+                writer.writeheader()
+                for batch in batches:
+                    writer.writerows(batch)
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                if buffer.tell():
+                    yield buffer.getvalue()
+            mimetype = 'text/csv'
+
+        response = Response(stream_with_context(generate()), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename=tickets.{export_format}'
+        return response
+
     @staticmethod
     def get_ticket_by_id(ticket_id):
         """Get a specific ticket by ID"""
         try:
-            ticket = TicketService.get_ticket_by_id(ticket_id)
+            # Conditional request: compare against updated_at only, no model load
+            if request.if_none_match:
+                updated_at = TicketService.get_ticket_updated_at(ticket_id)
+                if updated_at is not None:
+                    etag = ticket_etag(ticket_id, updated_at.isoformat())
+                    if request.if_none_match.contains(etag):
+                        response = Response(status=304)
+                        response.set_etag(etag)
+                        response.headers['Cache-Control'] = 'no-cache'
+                        return response
+
+            ticket = TicketService.get_ticket_dict(ticket_id)
             if not ticket:
                 return jsonify({
                     'error': 'Not Found',
                     'message': 'Ticket not found'
                 }), 404
 
-            return jsonify(ticket.to_dict()), 200
+            response = jsonify(ticket)
+            response.set_etag(ticket_etag(ticket['id'], ticket['updatedAt']))
+            response.headers['Cache-Control'] = 'no-cache'
+            return response, 200
 
         except Exception as e:
             return jsonify({
@@ -55,17 +245,68 @@ class TicketController:
 
     @staticmethod
     def create_ticket():
-        """Create a new ticket"""
+        """Create a new ticket; a repeated Idempotency-Key replays the first response"""
+        key = request.headers.get('Idempotency-Key')
+        if key is None:
+            return TicketController._create_ticket()
+
+        key = key.strip()
+        if not key or len(key) > 255:
+            return jsonify({
+                'error': 'Bad Request',
+                'message': 'Idempotency-Key must be between 1 and 255 characters'
+            }), 400
+
         try:
-            data = request.get_json()
-            if not data:
+            outcome, record = IdempotencyService.begin(
+                key, IdempotencyService.fingerprint(request.get_data())
+            )
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
+
+        if outcome == IdempotencyService.REPLAY:
+            response = Response(record.response_body, status=record.status_code,
+                                mimetype='application/json')
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+        if outcome == IdempotencyService.MISMATCH:
+            return jsonify({
+                'error': 'Unprocessable Entity',
+                'message': 'Idempotency-Key was already used with a different request body'
+            }), 422
+        if outcome == IdempotencyService.IN_PROGRESS:
+            return jsonify({
+                'error': 'Conflict',
+                'message': 'A request with this Idempotency-Key is still in progress'
+            }), 409
+
+        response = make_response(TicketController._create_ticket())
+        try:
+            # Server errors are not stored so the client can retry them
+            if response.status_code < 500:
+                IdempotencyService.complete(key, response.status_code, response.get_data(as_text=True))
+            else:
+                IdempotencyService.release(key)
+        except Exception as e:
+            current_app.logger.warning('Could not record Idempotency-Key %r: %s', key, e)
+        return response
+
+    @staticmethod
+    def _create_ticket():
+        """Validate the body and create the ticket"""
+        try:
+            body = request.get_data()
+            if not body.strip():
                 return jsonify({
                     'error': 'Bad Request',
                     'message': 'No JSON data provided'
                 }), 400
 
-            # Validate input using Pydantic
-            ticket_data = TicketCreateSchema(**data)
+            # Parse and validate the raw bytes in one pass inside pydantic-core
+            ticket_data = TicketCreateSchema.model_validate_json(body)
 
             # Create ticket
             ticket = TicketService.create_ticket(ticket_data.model_dump())
@@ -76,21 +317,101 @@ class TicketController:
             }), 201
 
         except ValidationError as e:
-            # Convert Pydantic errors to JSON-serializable format
-            error_details = []
-            for error in e.errors():
-                error_details.append({
-                    'field': error.get('loc', ['unknown'])[0] if error.get('loc') else 'unknown',
-                    'message': error.get('msg', 'Validation error'),
-                    'type': error.get('type', 'validation_error'),
-                    'input': str(error.get('input', ''))
-                })
-
-            return jsonify({
-                'error': 'Validation Error',
-                'message': 'Invalid input data',
-                'details': error_details
-            }), 400
+            return TicketController._validation_error(e)
+
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
+
+    @staticmethod
+    def create_tickets_batch():
+        """Create many tickets from a JSON array or NDJSON body"""
+        try:
+            errors = {}
+            item_errors = []
+            validated = None
+            if request.mimetype in ('application/x-ndjson', 'application/ndjson'):
+                items = []
+                lines = request.get_data(as_text=True).splitlines()
+                for line in (line for line in lines if line.strip()):
+                    try:
+                        items.append(json.loads(line))
+                    except ValueError as e:
+                        errors[len(items)] = [{
+                            'field': 'unknown',
+                            'message': f'Invalid JSON: {str(e)}',
+                            'type': 'json_invalid',
+                            'input': line
+                        }]
+                        items.append(None)
+            else:
+                # Fast path: a valid JSON array is parsed and validated from
+                # the raw bytes in one pass; anything else falls back to the
+                # per-item path below to report errors by index
+                try:
+                    validated = TicketBatchCreateAdapter.validate_json(request.get_data())
+                except ValidationError:
+                    validated = None
+                items = validated or request.get_json(silent=True)
+
+            if not isinstance(items, list) or not items:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': 'Request body must be a non-empty JSON array or NDJSON stream'
+                }), 400
+
+            max_size = current_app.config['TICKET_BATCH_MAX_SIZE']
+            if len(items) > max_size:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f'Batch size exceeds the maximum of {max_size} tickets'
+                }), 400
+
+            if validated is None:
+                # Validate the whole batch in one pass, then split errors per item
+                positions = [index for index in range(len(items)) if index not in errors]
+                try:
+                    validated = TicketBatchCreateAdapter.validate_python(
+                        [items[index] for index in positions]
+                    )
+                except ValidationError as e:
+                    for error in e.errors():
+                        loc = error.get('loc', ())
+                        index = positions[loc[0]] if loc else 0
+                        errors.setdefault(index, []).append({
+                            'field': loc[1] if len(loc) > 1 else 'unknown',
+                            'message': error.get('msg', 'Validation error'),
+                            'type': error.get('type', 'validation_error'),
+                            'input': str(error.get('input', ''))
+                        })
+                    validated = TicketBatchCreateAdapter.validate_python(
+                        [items[index] for index in positions if index not in errors]
+                    )
+
+                item_errors = [
+                    {'index': index, 'details': details}
+                    for index, details in sorted(errors.items())
+                ]
+                if not validated:
+                    return jsonify({
+                        'error': 'Validation Error',
+                        'message': 'Invalid input data',
+                        'errors': item_errors
+                    }), 400
+
+            ids = TicketService.create_tickets_bulk(
+                [ticket.model_dump() for ticket in validated],
+                chunk_size=current_app.config['TICKET_BATCH_CHUNK_SIZE']
+            )
+
+            return jsonify({
+                'message': f'{len(ids)} tickets created successfully',
+                'created': len(ids),
+                'ids': ids,
+                'errors': item_errors
+            }), 207 if item_errors else 201
 
         except Exception as e:
             return jsonify({
@@ -102,15 +423,34 @@ class TicketController:
     def update_ticket(ticket_id):
         """Update ticket (mark as used/unused)"""
         try:
-            data = request.get_json()
-            if not data:
+            body = request.get_data()
+            if not body.strip():
                 return jsonify({
                     'error': 'Bad Request',
                     'message': 'No JSON data provided'
                 }), 400
 
-            # Validate input using Pydantic
-            update_data = TicketUpdateSchema(**data)
+            # Parse and validate the raw bytes in one pass inside pydantic-core
+            update_data = TicketUpdateSchema.model_validate_json(body)
+
+            # Marking as used goes through the atomic redeem path
+            if update_data.isUsed:
+                outcome, ticket_dict = TicketService.redeem_ticket(ticket_id)
+                if outcome == TicketService.NOT_FOUND:
+                    return jsonify({
+                        'error': 'Not Found',
+                        'message': 'Ticket not found'
+                    }), 404
+                if outcome == TicketService.ALREADY_USED:
+                    return jsonify({
+                        'error': 'Conflict',
+                        'message': 'Ticket has already been used'
+                    }), 409
+
+                return jsonify({
+                    'message': 'Ticket updated successfully',
+                    'ticket': ticket_dict
+                }), 200
 
             # Update ticket
             ticket = TicketService.mark_ticket_as_used(ticket_id, update_data.isUsed)
@@ -126,21 +466,55 @@ class TicketController:
             }), 200
 
         except ValidationError as e:
-            # Convert Pydantic errors to JSON-serializable format
-            error_details = []
-            for error in e.errors():
-                error_details.append({
-                    'field': error.get('loc', ['unknown'])[0] if error.get('loc') else 'unknown',
-                    'message': error.get('msg', 'Validation error'),
-                    'type': error.get('type', 'validation_error'),
-                    'input': str(error.get('input', ''))
-                })
-
-            return jsonify({
-                'error': 'Validation Error',
-                'message': 'Invalid input data',
-                'details': error_details
-            }), 400
+            return TicketController._validation_error(e)
+
+        except Exception as e:
+            return jsonify({
+                'error': 'Internal Server Error',
+                'message': str(e)
+            }), 500
+
+    @staticmethod
+    def redeem_tickets():
+        """Redeem a batch of scanned tickets"""
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': 'No JSON data provided'
+                }), 400
+
+            # Validate input using Pydantic
+            redeem_data = TicketRedeemSchema(**data)
+
+            max_size = current_app.config['TICKET_REDEEM_MAX_SIZE']
+            if len(redeem_data.ids) > max_size:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f'Cannot redeem more than {max_size} tickets per request'
+                }), 400
+
+            outcomes = TicketService.redeem_tickets(redeem_data.ids)
+
+            summary = {
+                TicketService.REDEEMED: 0,
+                TicketService.ALREADY_USED: 0,
+                TicketService.NOT_FOUND: 0
+            }
+            for outcome in outcomes.values():
+                summary[outcome] += 1
+
+            return jsonify({
+                'results': [
+                    {'id': ticket_id, 'status': outcome}
+                    for ticket_id, outcome in outcomes.items()
+                ],
+                'summary': summary
+            }), 200
+
+        except ValidationError as e:
+            return TicketController._validation_error(e)
 
         except Exception as e:
             return jsonify({
@@ -1,3 +1,10 @@
+from .event import Event
 from .ticket import Ticket
+from .ticket_archive import TicketArchive
+from .ticket_tombstone import TicketTombstone
+from .ticket_sync_state import TicketSyncState
+from .event_stats import EventStats
+from .idempotency_key import IdempotencyKey
+from . import ticket_search  # noqa: F401 - registers the search index DDL
 
-__all__ = ['Ticket']
+__all__ = ['Event', 'Ticket', 'TicketArchive', 'TicketTombstone', 'TicketSyncState', 'EventStats', 'IdempotencyKey']
@@ -0,0 +1,31 @@
+from datetime import datetime
+from app.utils.extensions import db
+
+
+class Event(db.Model):
+    """An event that tickets are issued for
+
+    One row per distinct (name, location, time); tickets reference it by
+    event_id instead of repeating those values on every row.
+    """
+    __tablename__ = 'events'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(255), nullable=False)
+    location = db.Column(db.String(255), nullable=False)
+    time = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Deduplication key; also serves name lookups
+        db.UniqueConstraint('name', 'location', 'time', name='uq_events_name_location_time'),
+        # Per-event lookups, ordered or ranged by event time
+        db.Index('ix_events_name_time', 'name', 'time'),
+        # Per-venue lookups, ordered or ranged by event time
+        db.Index('ix_events_location_time', 'location', 'time'),
+        # Time-range queries across events
+        db.Index('ix_events_time', 'time'),
+    )
+
+    def __repr__(self):
+        return f'<Event {self.id}: {self.name}>'
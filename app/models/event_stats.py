@@ -0,0 +1,29 @@
+from datetime import datetime
+from app.utils.extensions import db
+
+
+class EventStats(db.Model):
+    """Per-event ticket counters, kept in step by TicketService writes
+
+    Counts cover live and archived tickets. `flask rebuild-event-stats`
+    recomputes the table from scratch.
+    """
+    __tablename__ = 'event_stats'
+
+    event_name = db.Column(db.String(255), primary_key=True)
+    total_tickets = db.Column(db.Integer, default=0, nullable=False)
+    used_tickets = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<EventStats {self.event_name}: {self.used_tickets}/{self.total_tickets}>'
+
+    def to_dict(self):
+        """Convert event stats to dictionary"""
+        return {
+            'eventName': self.event_name,
+            'totalTickets': self.total_tickets,
+            'usedTickets': self.used_tickets,
+            'unusedTickets': self.total_tickets - self.used_tickets,
+            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
+        }
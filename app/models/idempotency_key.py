@@ -0,0 +1,24 @@
+from datetime import datetime
+from app.utils.extensions import db
+
+
+class IdempotencyKey(db.Model):
+    """First response recorded for an Idempotency-Key
+
+    A row with a NULL status_code is a reservation: the first request is
+    still running and duplicates wait for it to finish.
+    """
+    __tablename__ = 'idempotency_keys'
+
+    key = db.Column(db.String(255), primary_key=True)
+    request_hash = db.Column(db.String(64), nullable=False)
+    status_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<IdempotencyKey {self.key}: {self.status_code}>'
+
+    @property
+    def is_complete(self) -> bool:
+        return self.status_code is not None
@@ -1,5 +1,6 @@
 from datetime import datetime
 from app.utils.extensions import db
+from app.models.event import Event
 
 
 class Ticket(db.Model):
@@ -7,12 +8,41 @@ class Ticket(db.Model):
     __tablename__ = 'tickets'
 
     id = db.Column(db.Integer, primary_key=True)
-    event_name = db.Column(db.String(255), nullable=False)
-    location = db.Column(db.String(255), nullable=False)
-    time = db.Column(db.DateTime, nullable=False)
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
     is_used = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Sequence number of the last write, for GET /tickets/changes
+    change_seq = db.Column(db.BigInteger, default=0, nullable=False)
+
+    __table_args__ = (
+        # Keyset / newest-first listing: ORDER BY created_at DESC, id DESC
+        db.Index('ix_tickets_created_at_id', 'created_at', 'id'),
+        # Tickets of one event, newest first; also backs the foreign key
+        db.Index('ix_tickets_event_id_created_at', 'event_id', 'created_at', 'id'),
+        # Change feed: WHERE (change_seq, id) > (?, ?) ORDER BY change_seq, id
+        db.Index('ix_tickets_change_seq_id', 'change_seq', 'id'),
+        # is_used filter, newest first, for either value
+        db.Index('ix_tickets_is_used_created_at', 'is_used', 'created_at', 'id'),
+        # Never hand out an ID again on SQLite, even after the highest one is
+        # deleted or archived; archived tickets keep theirs
+        {'sqlite_autoincrement': True},
+    )
+
+    # Joined into the same SELECT, so to_dict() needs no second query
+    event = db.relationship(Event, lazy='joined', innerjoin=True)
+
+    @property
+    def event_name(self):
+        return self.event.name if self.event else None
+
+    @property
+    def location(self):
+        return self.event.location if self.event else None
+
+    @property
+    def time(self):
+        return self.event.time if self.event else None
 
     def __repr__(self):
         return f'<Ticket {self.id}: {self.event_name}>'
@@ -28,3 +58,16 @@ class Ticket(db.Model):
             'createdAt': self.created_at.isoformat() if self.created_at else None,
             'updatedAt': self.updated_at.isoformat() if self.updated_at else None
         }
+
+    @staticmethod
+    def row_to_dict(row):
+        """Convert a Core row (or mapping) of ticket columns to the to_dict() shape"""
+        return {
+            'id': row['id'],
+            'eventName': row['event_name'],
+            'location': row['location'],
+            'time': row['time'].isoformat() if row['time'] else None,
+            'isUsed': row['is_used'],
+            'createdAt': row['created_at'].isoformat() if row['created_at'] else None,
+            'updatedAt': row['updated_at'].isoformat() if row['updated_at'] else None
+        }
@@ -0,0 +1,27 @@
+from datetime import datetime
+from app.utils.extensions import db
+from app.models.ticket import Ticket
+
+
+class TicketArchive(db.Model):
+    """Tickets for past events, moved out of the hot tickets table
+
+    Rows keep their original IDs and timestamps, so by-ID lookups that miss
+    the hot table can fall through here and return the same payload.
+    """
+    __tablename__ = 'tickets_archive'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    event_name = db.Column(db.String(255), nullable=False)
+    location = db.Column(db.String(255), nullable=False)
+    time = db.Column(db.DateTime, nullable=False)
+    is_used = db.Column(db.Boolean, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<TicketArchive {self.id}: {self.event_name}>'
+
+    # Same API shape as a live ticket
+    to_dict = Ticket.to_dict
@@ -0,0 +1,91 @@
+"""Full-text search index over event names and locations
+
+Ticket search matches events and joins their tickets. SQLite uses an
+external-content FTS5 table kept in sync by triggers. PostgreSQL uses a GIN
+expression index over a tsvector, which the database maintains by itself.
+Both are created alongside the events table.
+"""
+
+from sqlalchemy import event
+from app.models.event import Event
+
+# Must match the indexed expression exactly for PostgreSQL to use the index
+POSTGRES_SEARCH_VECTOR = "to_tsvector('simple', name || ' ' || location)"
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        name, location,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+    END
+    """,
+    # Only fires when searchable columns change
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF name, location ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+        INSERT INTO events_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    # Index rows that existed before the search table did
+    "INSERT INTO events_fts(events_fts) VALUES ('rebuild')",
+]
+
+SQLITE_SEARCH_DROP_DDL = [
+    'DROP TRIGGER IF EXISTS events_fts_au',
+    'DROP TRIGGER IF EXISTS events_fts_ad',
+    'DROP TRIGGER IF EXISTS events_fts_ai',
+    'DROP TABLE IF EXISTS events_fts',
+]
+
+POSTGRES_SEARCH_DDL = [
+    f'CREATE INDEX IF NOT EXISTS ix_events_search ON events USING GIN ({POSTGRES_SEARCH_VECTOR})',
+]
+
+POSTGRES_SEARCH_DROP_DDL = [
+    'DROP INDEX IF EXISTS ix_events_search',
+]
+
+# Schema objects managed here rather than by the SQLAlchemy metadata
+SEARCH_OBJECT_NAMES = ('events_fts', 'ix_events_search')
+
+
+def search_ddl(dialect_name: str, drop: bool = False):
+    """Return the statements that create (or drop) the search index"""
+    if dialect_name == 'sqlite':
+        return SQLITE_SEARCH_DROP_DDL if drop else SQLITE_SEARCH_DDL
+    if dialect_name == 'postgresql':
+        return POSTGRES_SEARCH_DROP_DDL if drop else POSTGRES_SEARCH_DDL
+    return []
+
+
+def is_search_object(name: str) -> bool:
+    """True for the FTS table, its shadow tables and the GIN index"""
+    return bool(name) and name.startswith(SEARCH_OBJECT_NAMES)
+
+
+@event.listens_for(Event.__table__, 'after_create')
+def create_search_index(target, connection, **kw):
+    for statement in search_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Event.__table__, 'before_drop')
+def drop_search_index(target, connection, **kw):
+    for statement in search_ddl(connection.dialect.name, drop=True):
+        connection.exec_driver_sql(statement)
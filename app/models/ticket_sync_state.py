@@ -0,0 +1,27 @@
+from sqlalchemy import event
+from app.utils.extensions import db
+
+
+class TicketSyncState(db.Model):
+    """Single-row high-water marks for the ticket change feed
+
+    change_seq is the last sequence number handed to a ticket write.
+    tombstone_floor is the highest sequence number of a purged tombstone;
+    sync tokens older than it may have missed deletes.
+    """
+    __tablename__ = 'ticket_sync_state'
+
+    # The only row
+    ROW_ID = 1
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    change_seq = db.Column(db.BigInteger, default=0, nullable=False)
+    tombstone_floor = db.Column(db.BigInteger, default=0, nullable=False)
+
+    def __repr__(self):
+        return f'<TicketSyncState {self.change_seq} (floor {self.tombstone_floor})>'
+
+
+@event.listens_for(TicketSyncState.__table__, 'after_create')
+def insert_sync_state_row(target, connection, **kw):
+    connection.execute(target.insert().values(id=TicketSyncState.ROW_ID, change_seq=0, tombstone_floor=0))
@@ -0,0 +1,23 @@
+from datetime import datetime
+from app.utils.extensions import db
+
+
+class TicketTombstone(db.Model):
+    """Marker for a ticket removed from the tickets table, for the change feed
+
+    Written when a ticket is deleted or archived so synced devices learn to
+    drop it. `flask purge-ticket-tombstones` removes old markers.
+    """
+    __tablename__ = 'ticket_tombstones'
+
+    ticket_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    change_seq = db.Column(db.BigInteger, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    __table_args__ = (
+        # Change feed: WHERE (change_seq, ticket_id) > (?, ?) ORDER BY change_seq, ticket_id
+        db.Index('ix_ticket_tombstones_change_seq', 'change_seq', 'ticket_id'),
+    )
+
+    def __repr__(self):
+        return f'<TicketTombstone {self.ticket_id}: {self.change_seq}>'
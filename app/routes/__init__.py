@@ -1,3 +1,4 @@
 from .ticket_routes import tickets_bp
+from .event_routes import events_bp
 
-__all__ = ['tickets_bp']
+__all__ = ['tickets_bp', 'events_bp']
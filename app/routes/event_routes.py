@@ -0,0 +1,17 @@
+from flask import Blueprint
+from app.utils.docs import swag_from
+from app.utils.extensions import read_replica
+from app.controllers.event_controller import EventController
+
+# Create blueprint
+events_bp = Blueprint('events', __name__, url_prefix='/events')
+
+# GET routes read from the replica bind, when one is configured
+events_bp.before_request(read_replica.route_reads)
+
+
+@events_bp.route('/<path:event_name>/stats', methods=['GET'])
+@swag_from('../docs/swagger/events/get_event_stats.yml')
+def get_event_stats(event_name):
+    """Get event stats endpoint"""
+    return EventController.get_event_stats(event_name)
@@ -1,10 +1,15 @@
 from flask import Blueprint
-from flasgger import swag_from
+from app.utils.docs import swag_from
+from app.utils.extensions import read_replica
 from app.controllers.ticket_controller import TicketController
 
 # Create blueprint
 tickets_bp = Blueprint('tickets', __name__, url_prefix='/tickets')
 
+# GET routes read from the replica bind, when one is configured
+tickets_bp.before_request(read_replica.route_reads)
+tickets_bp.after_request(read_replica.remember_writes)
+
 
 @tickets_bp.route('', methods=['GET'])
 @swag_from('../docs/swagger/tickets/get_tickets.yml')
@@ -20,6 +25,41 @@ def create_ticket():
     return TicketController.create_ticket()
 
 
+@tickets_bp.route('/search', methods=['GET'])
+@swag_from('../docs/swagger/tickets/search_tickets.yml')
+def search_tickets():
+    """Full-text search endpoint"""
+    return TicketController.search_tickets()
+
+
+@tickets_bp.route('/changes', methods=['GET'])
+@swag_from('../docs/swagger/tickets/get_ticket_changes.yml')
+def get_ticket_changes():
+    """Ticket change feed endpoint"""
+    return TicketController.get_ticket_changes()
+
+
+@tickets_bp.route('/export', methods=['GET'])
+@swag_from('../docs/swagger/tickets/export_tickets.yml')
+def export_tickets():
+    """Streaming export endpoint"""
+    return TicketController.export_tickets()
+
+
+@tickets_bp.route('/batch', methods=['POST'])
+@swag_from('../docs/swagger/tickets/create_tickets_batch.yml')
+def create_tickets_batch():
+    """Bulk create tickets endpoint"""
+    return TicketController.create_tickets_batch()
+
+
+@tickets_bp.route('/redeem', methods=['POST'])
+@swag_from('../docs/swagger/tickets/redeem_tickets.yml')
+def redeem_tickets():
+    """Batch redeem (gate scan) endpoint"""
+    return TicketController.redeem_tickets()
+
+
 @tickets_bp.route('/<int:ticket_id>', methods=['GET'])
 @swag_from('../docs/swagger/tickets/get_ticket.yml')
 def get_ticket(ticket_id):
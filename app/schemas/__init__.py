@@ -1,6 +1,11 @@
 from .ticket_schemas import (
     TicketCreateSchema,
+    TicketBatchCreateAdapter,
     TicketUpdateSchema,
+    TicketRedeemSchema,
+    TicketFilterSchema,
+    TicketSearchSchema,
+    TicketChangesSchema,
     TicketResponseSchema,
     TicketListResponseSchema,
     ErrorResponseSchema
@@ -8,7 +13,12 @@ from .ticket_schemas import (
 
 __all__ = [
     'TicketCreateSchema',
+    'TicketBatchCreateAdapter',
     'TicketUpdateSchema',
+    'TicketRedeemSchema',
+    'TicketFilterSchema',
+    'TicketSearchSchema',
+    'TicketChangesSchema',
     'TicketResponseSchema',
     'TicketListResponseSchema',
     'ErrorResponseSchema'
@@ -1,10 +1,16 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, FutureDatetime, TypeAdapter, model_validator
 
 
 class TicketCreateSchema(BaseModel):
-    """Schema for creating a new ticket"""
+    """Schema for creating a new ticket
+
+    All constraints are declarative so they run inside pydantic-core:
+    whitespace is stripped before min_length rejects blank names, and
+    FutureDatetime rejects past event times (naive values are compared with
+    local time, like datetime.now()).
+    """
     model_config = ConfigDict(str_strip_whitespace=True)
 
     eventName: str = Field(
@@ -19,31 +25,14 @@ class TicketCreateSchema(BaseModel):
         max_length=255,
         description="Location of the event"
     )
-    time: datetime = Field(
+    time: FutureDatetime = Field(
         ...,
         description="Event time in ISO format"
     )
 
-    @field_validator('eventName')
-    @classmethod
-    def validate_event_name(cls, v):
-        if not v or v.isspace():
-            raise ValueError('Event name is required and cannot be empty')
-        return v.strip()
-
-    @field_validator('location')
-    @classmethod
-    def validate_location(cls, v):
-        if not v or v.isspace():
-            raise ValueError('Location is required and cannot be empty')
-        return v.strip()
 
-    @field_validator('time')
-    @classmethod
-    def validate_time(cls, v):
-        if v < datetime.now():
-            raise ValueError('Event time cannot be in the past')
-        return v
+# Validates a whole batch of create payloads in a single pass
+TicketBatchCreateAdapter = TypeAdapter(List[TicketCreateSchema])
 
 
 class TicketUpdateSchema(BaseModel):
@@ -56,6 +45,83 @@ class TicketUpdateSchema(BaseModel):
     )
 
 
+class TicketRedeemSchema(BaseModel):
+    """Schema for redeeming a batch of scanned tickets"""
+    ids: List[int] = Field(
+        ...,
+        min_length=1,
+        description="IDs of the scanned tickets"
+    )
+
+
+class TicketFilterSchema(BaseModel):
+    """Schema for the list/export query string filters"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore')
+
+    event_name: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Exact event name"
+    )
+    location: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Exact event location"
+    )
+    time_from: Optional[datetime] = Field(
+        None,
+        description="Only events at or after this time (ISO format)"
+    )
+    time_to: Optional[datetime] = Field(
+        None,
+        description="Only events at or before this time (ISO format)"
+    )
+    is_used: Optional[bool] = Field(
+        None,
+        description="Only used (true) or unused (false) tickets"
+    )
+
+    @model_validator(mode='after')
+    def validate_time_range(self):
+        if self.time_from and self.time_to and self.time_from > self.time_to:
+            raise ValueError('time_from must not be later than time_to')
+        return self
+
+
+class TicketSearchSchema(BaseModel):
+    """Schema for the full-text search query string"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore')
+
+    q: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Words to match against event names and locations"
+    )
+    per_page: int = Field(10, ge=1, le=100, description="Results per page (max 100)")
+    cursor: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="next_cursor from the previous page; omit for the first page"
+    )
+
+
+class TicketChangesSchema(BaseModel):
+    """Schema for the change feed query string"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore')
+
+    since: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="next_token from the previous response; omit for a full sync"
+    )
+    limit: int = Field(1000, ge=1, le=10000, description="Changes per page (max 10000)")
+
+
 class TicketResponseSchema(BaseModel):
     """Schema for ticket response"""
     model_config = ConfigDict(from_attributes=True)
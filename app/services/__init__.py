@@ -1,3 +1,6 @@
 from .ticket_service import TicketService
+from .idempotency_service import IdempotencyService
+from .event_stats_service import EventStatsService
+from .event_service import EventService
 
-__all__ = ['TicketService']
+__all__ = ['TicketService', 'IdempotencyService', 'EventStatsService', 'EventService']
@@ -0,0 +1,118 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.event import Event
+from app.utils.extensions import db, event_cache
+
+# (name, location, time): what makes two tickets belong to the same event
+EventKey = Tuple[str, str, datetime]
+
+
+class EventService:
+    """Service class for events and the cached event lookups behind tickets"""
+
+    # Keys or IDs per IN (...) lookup
+    LOOKUP_CHUNK_SIZE = 500
+
+    @staticmethod
+    def event_key(name: str, location: str, time: datetime) -> EventKey:
+        """The deduplication key for an event
+
+        Offset-aware times are kept as their wall-clock value, which is what
+        SQLite always stored for tickets, so equal inputs map to one event.
+        """
+        if time.tzinfo is not None:
+            time = time.replace(tzinfo=None)
+        return name, location, time
+
+    @staticmethod
+    def resolve_event_ids(keys: Iterable[EventKey]) -> Dict[EventKey, int]:
+        """Map event keys to event IDs, creating the events that do not exist yet
+
+        Runs in the caller's transaction and does not commit. Known keys are
+        served from the event cache, the rest are looked up in chunks, and only
+        events still missing are inserted. IDs of events inserted here are not
+        cached, so a rollback cannot leave a dangling ID behind.
+        """
+        ids = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            found, event_id = event_cache.get(('key',) + key)
+            if found:
+                ids[key] = event_id
+            else:
+                missing.append(key)
+
+        if missing:
+            existing = EventService._select_ids(missing)
+            for key, event_id in existing.items():
+                event_cache.set(('key',) + key, event_id)
+            ids.update(existing)
+            missing = [key for key in missing if key not in existing]
+
+        if missing:
+            EventService._insert_events(missing)
+            ids.update(EventService._select_ids(missing))
+        return ids
+
+    @staticmethod
+    def get_event_rows(event_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Get events by ID as ticket-row fields (event_name, location, time)
+
+        Read through the event cache; misses are fetched with one query per
+        chunk. Events are never updated, so cached rows cannot go stale.
+        """
+        rows = {}
+        missing = []
+        for event_id in dict.fromkeys(event_ids):
+            found, row = event_cache.get(('id', event_id))
+            if found:
+                rows[event_id] = row
+            else:
+                missing.append(event_id)
+
+        for start in range(0, len(missing), EventService.LOOKUP_CHUNK_SIZE):
+            chunk = missing[start:start + EventService.LOOKUP_CHUNK_SIZE]
+            result = db.session.execute(
+                select(Event.id, Event.name, Event.location, Event.time).where(Event.id.in_(chunk))
+            )
+            for event_id, name, location, time in result:
+                row = {'event_name': name, 'location': location, 'time': time}
+                event_cache.set(('id', event_id), row)
+                rows[event_id] = row
+        return rows
+
+    @staticmethod
+    def get_event_row(event_id: int) -> Optional[Dict[str, Any]]:
+        """Get one event as ticket-row fields, read through the event cache"""
+        return EventService.get_event_rows([event_id]).get(event_id)
+
+    @staticmethod
+    def _select_ids(keys: List[EventKey]) -> Dict[EventKey, int]:
+        ids = {}
+        for start in range(0, len(keys), EventService.LOOKUP_CHUNK_SIZE):
+            chunk = keys[start:start + EventService.LOOKUP_CHUNK_SIZE]
+            result = db.session.execute(
+                select(Event.name, Event.location, Event.time, Event.id)
+                .where(tuple_(Event.name, Event.location, Event.time).in_(chunk))
+            )
+            for name, location, time, event_id in result:
+                ids[(name, location, time)] = event_id
+        return ids
+
+    @staticmethod
+    def _insert_events(keys: List[EventKey]):
+        """Insert events, skipping any that a concurrent writer just created"""
+        rows = [{'name': name, 'location': location, 'time': time} for name, location, time in keys]
+        dialect = db.engine.dialect.name
+        for start in range(0, len(rows), EventService.LOOKUP_CHUNK_SIZE):
+            chunk = rows[start:start + EventService.LOOKUP_CHUNK_SIZE]
+            if dialect in ('sqlite', 'postgresql'):
+                dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+                db.session.execute(
+                    dialect_insert(Event).values(chunk)
+                    .on_conflict_do_nothing(index_elements=['name', 'location', 'time'])
+                )
+            else:
+                db.session.execute(insert(Event), chunk)
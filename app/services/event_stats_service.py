@@ -0,0 +1,109 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import case, delete, func, insert, literal, select, true, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from app.models.event import Event
+from app.models.event_stats import EventStats
+from app.models.ticket import Ticket
+from app.models.ticket_archive import TicketArchive
+from app.utils.extensions import db
+
+
+class EventStatsService:
+    """Service class for the per-event ticket counters"""
+
+    @staticmethod
+    def deltas(changes: Iterable[Tuple[str, int, int]]) -> Dict[str, Tuple[int, int]]:
+        """Sum (event_name, total_delta, used_delta) changes per event"""
+        totals = defaultdict(lambda: [0, 0])
+        for event_name, total_delta, used_delta in changes:
+            totals[event_name][0] += total_delta
+            totals[event_name][1] += used_delta
+        return {name: (total, used) for name, (total, used) in totals.items() if total or used}
+
+    @staticmethod
+    def adjust(deltas: Dict[str, Tuple[int, int]]):
+        """Apply (total, used) deltas per event in the caller's transaction
+
+        Does not commit: callers run this right before committing their own
+        ticket writes, so the counters change atomically with the tickets.
+        One upsert covers all events on SQLite and PostgreSQL.
+        """
+        if not deltas:
+            return
+        now = datetime.utcnow()
+        rows = [
+            {'event_name': name, 'total_tickets': total, 'used_tickets': used, 'updated_at': now}
+            for name, (total, used) in sorted(deltas.items())
+        ]
+        dialect = db.engine.dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+            stmt = dialect_insert(EventStats).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[EventStats.event_name],
+                set_={
+                    'total_tickets': EventStats.total_tickets + stmt.excluded.total_tickets,
+                    'used_tickets': EventStats.used_tickets + stmt.excluded.used_tickets,
+                    'updated_at': stmt.excluded.updated_at
+                }
+            )
+            db.session.execute(stmt)
+            return
+
+        for row in rows:
+            result = db.session.execute(
+                update(EventStats)
+                .where(EventStats.event_name == row['event_name'])
+                .values(
+                    total_tickets=EventStats.total_tickets + row['total_tickets'],
+                    used_tickets=EventStats.used_tickets + row['used_tickets'],
+                    updated_at=now
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if not result.rowcount:
+                db.session.execute(insert(EventStats).values(row))
+
+    @staticmethod
+    def get_event_stats(event_name: str) -> Optional[EventStats]:
+        """Get the counters for one event"""
+        try:
+            return db.session.get(EventStats, event_name)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def rebuild() -> int:
+        """Recompute every event's counters from tickets and tickets_archive
+
+        Runs as one transaction. Returns the number of events.
+        """
+        tickets = union_all(
+            select(Event.name.label('event_name'), Ticket.is_used)
+            .join_from(Ticket, Event, Ticket.event_id == Event.id),
+            select(TicketArchive.event_name, TicketArchive.is_used)
+        ).subquery()
+        aggregate = (
+            select(
+                tickets.c.event_name,
+                func.count(),
+                func.sum(case((tickets.c.is_used == true(), 1), else_=0)),
+                literal(datetime.utcnow())
+            )
+            .group_by(tickets.c.event_name)
+        )
+        try:
+            db.session.execute(delete(EventStats))
+            db.session.execute(
+                insert(EventStats).from_select(
+                    ['event_name', 'total_tickets', 'used_tickets', 'updated_at'], aggregate
+                )
+            )
+            db.session.commit()
+            return db.session.execute(select(func.count()).select_from(EventStats)).scalar_one()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to rebuild event stats: {str(e)}")
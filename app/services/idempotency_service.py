@@ -0,0 +1,179 @@
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from flask import current_app
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.models.idempotency_key import IdempotencyKey
+from app.utils.extensions import db
+
+
+class IdempotencyService:
+    """Service class for Idempotency-Key reservations and replays"""
+
+    # begin() outcomes
+    STARTED = 'started'
+    REPLAY = 'replay'
+    MISMATCH = 'mismatch'
+    IN_PROGRESS = 'in_progress'
+
+    # Upper bound between checks while another process holds a key
+    POLL_INTERVAL = 0.05
+
+    # Duplicates in this process wait on an event instead of polling
+    _inflight: Dict[str, threading.Event] = {}
+    _inflight_lock = threading.Lock()
+    _last_purge = 0.0
+
+    @staticmethod
+    def fingerprint(body: bytes) -> str:
+        """Hash of the request body; a key may only be replayed for the same body"""
+        return hashlib.sha256(body).hexdigest()
+
+    @staticmethod
+    def begin(key: str, request_hash: str) -> Tuple[str, Optional[IdempotencyKey]]:
+        """Reserve `key`, or wait for the request that already holds it
+
+        Returns (STARTED, None) when the caller owns the key and must call
+        complete() or release(). Otherwise returns the stored record with
+        REPLAY, MISMATCH (same key, different body) or IN_PROGRESS (the first
+        request did not finish within IDEMPOTENCY_WAIT_TIMEOUT).
+        """
+        config = current_app.config
+        IdempotencyService._maybe_purge()
+        deadline = time.monotonic() + config['IDEMPOTENCY_WAIT_TIMEOUT']
+        try:
+            while True:
+                if IdempotencyService._reserve(key, request_hash):
+                    return IdempotencyService.STARTED, None
+
+                record = IdempotencyService._load(key)
+                if record is None:
+                    # Released or purged since the reservation attempt
+                    continue
+
+                age = (datetime.utcnow() - record.created_at).total_seconds()
+                if age > config['IDEMPOTENCY_TTL'] or (
+                        not record.is_complete and age > config['IDEMPOTENCY_LOCK_TIMEOUT']):
+                    # Expired, or abandoned by a worker that died mid-request
+                    db.session.execute(delete(IdempotencyKey).where(
+                        IdempotencyKey.key == key,
+                        IdempotencyKey.created_at == record.created_at
+                    ))
+                    db.session.commit()
+                    continue
+
+                if record.request_hash != request_hash:
+                    return IdempotencyService.MISMATCH, record
+                if record.is_complete:
+                    return IdempotencyService.REPLAY, record
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return IdempotencyService.IN_PROGRESS, record
+                IdempotencyService._wait(key, remaining)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def complete(key: str, status_code: int, response_body: str):
+        """Store the response of the request holding `key` and wake up duplicates"""
+        try:
+            db.session.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.key == key)
+                .values(status_code=status_code, response_body=response_body)
+            )
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Database error: {str(e)}")
+        finally:
+            IdempotencyService._notify(key)
+
+    @staticmethod
+    def release(key: str):
+        """Drop an unfinished reservation so the request can be retried"""
+        try:
+            db.session.execute(delete(IdempotencyKey).where(
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None)
+            ))
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Database error: {str(e)}")
+        finally:
+            IdempotencyService._notify(key)
+
+    @staticmethod
+    def purge_expired(ttl: Optional[int] = None) -> int:
+        """Delete keys older than the TTL and return how many were removed"""
+        if ttl is None:
+            ttl = current_app.config['IDEMPOTENCY_TTL']
+        cutoff = datetime.utcnow() - timedelta(seconds=ttl)
+        try:
+            result = db.session.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+            )
+            db.session.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def _maybe_purge():
+        """Evict expired keys at most once per IDEMPOTENCY_PURGE_INTERVAL per process"""
+        now = time.monotonic()
+        if now - IdempotencyService._last_purge < current_app.config['IDEMPOTENCY_PURGE_INTERVAL']:
+            return
+        IdempotencyService._last_purge = now
+        IdempotencyService.purge_expired()
+
+    @staticmethod
+    def _reserve(key: str, request_hash: str) -> bool:
+        """Insert a pending row; the primary key makes exactly one request win"""
+        event = threading.Event()
+        try:
+            db.session.add(IdempotencyKey(key=key, request_hash=request_hash))
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return False
+        with IdempotencyService._inflight_lock:
+            IdempotencyService._inflight[key] = event
+        return True
+
+    @staticmethod
+    def _load(key: str) -> Optional[IdempotencyKey]:
+        """Read the current row in a short transaction and detach it"""
+        record = db.session.execute(
+            select(IdempotencyKey)
+            .where(IdempotencyKey.key == key)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if record is not None:
+            db.session.expunge(record)
+        # End the read transaction so the next check sees new commits
+        db.session.commit()
+        return record
+
+    @staticmethod
+    def _wait(key: str, timeout: float):
+        with IdempotencyService._inflight_lock:
+            event = IdempotencyService._inflight.get(key)
+        if event is not None:
+            event.wait(timeout)
+        else:
+            time.sleep(min(timeout, IdempotencyService.POLL_INTERVAL))
+
+    @staticmethod
+    def _notify(key: str):
+        with IdempotencyService._inflight_lock:
+            event = IdempotencyService._inflight.pop(key, None)
+        if event is not None:
+            event.set()
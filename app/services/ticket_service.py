@@ -1,46 +1,708 @@
-from typing import List, Optional, Dict, Any
+import math
+import re
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Union
+from flask import current_app
+from sqlalchemy import Float, Integer, delete, false, func, insert, literal, literal_column, or_, select, text, true, tuple_, update
+from sqlalchemy.sql import Select
 from sqlalchemy.exc import SQLAlchemyError
+from app.models.event import Event
 from app.models.ticket import Ticket
-from app.utils.extensions import db
+from app.models.ticket_archive import TicketArchive
+from app.models.ticket_sync_state import TicketSyncState
+from app.models.ticket_tombstone import TicketTombstone
+from app.services.event_service import EventService
+from app.services.event_stats_service import EventStatsService
+from app.models.ticket_search import POSTGRES_SEARCH_VECTOR
+from app.utils.cursor import (
+    encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor,
+    encode_sync_token, decode_sync_token
+)
+from app.utils.extensions import db, ticket_cache, count_cache
+from app.utils.group_commit import BatchWriter
+from app.utils.replica import reading_from_replica
+
+
+class SyncTokenExpiredError(Exception):
+    """A change feed token predates purged tombstones; the client must resync"""
 
 
 class TicketService:
     """Service class for ticket business logic"""
 
+    # Redeem outcomes
+    REDEEMED = 'redeemed'
+    ALREADY_USED = 'already_used'
+    NOT_FOUND = 'not_found'
+
+    # Count cache key for the unfiltered ticket total
+    TOTAL_COUNT_KEY = 'all'
+
+    # Filters on columns of the events table
+    EVENT_FILTERS = ('event_name', 'location', 'time_from', 'time_to')
+
+    # Guards starting the per-app group-commit writer
+    _writer_lock = threading.Lock()
+
+    @staticmethod
+    def select_rows() -> Select:
+        """Select tickets as flat rows of the columns row_to_dict() expects
+
+        The event's name, location and time are joined in from events under
+        the names they had when they were ticket columns.
+        """
+        return select(
+            Ticket.id,
+            Event.name.label('event_name'),
+            Event.location.label('location'),
+            Event.time.label('time'),
+            Ticket.is_used,
+            Ticket.created_at,
+            Ticket.updated_at
+        ).join_from(Ticket, Event, Ticket.event_id == Event.id)
+
+    @staticmethod
+    def apply_filters(stmt: Select, filters: Optional[Dict[str, Any]] = None) -> Select:
+        """Add the list filters to a statement as index-friendly WHERE clauses
+
+        Supported keys: event_name, location, time_from, time_to and is_used.
+        The first four filter on events, which the statement must join.
+        """
+        if not filters:
+            return stmt
+        if filters.get('event_name') is not None:
+            stmt = stmt.where(Event.name == filters['event_name'])
+        if filters.get('location') is not None:
+            stmt = stmt.where(Event.location == filters['location'])
+        if filters.get('time_from') is not None:
+            stmt = stmt.where(Event.time >= filters['time_from'])
+        if filters.get('time_to') is not None:
+            stmt = stmt.where(Event.time <= filters['time_to'])
+        if filters.get('is_used') is not None:
+            # Render a literal, not a bound parameter, so the planner can
+            # estimate how selective the value is
+            stmt = stmt.where(Ticket.is_used == (true() if filters['is_used'] else false()))
+        return stmt
+
+    @staticmethod
+    def build_list_statement(filters: Optional[Dict[str, Any]] = None) -> Select:
+        """Select the ticket columns, filtered and ordered newest first"""
+        stmt = TicketService.apply_filters(TicketService.select_rows(), filters)
+        return stmt.order_by(Ticket.created_at.desc(), Ticket.id.desc())
+
+    @staticmethod
+    def _count_key(filters: Optional[Dict[str, Any]] = None):
+        active = {key: value for key, value in (filters or {}).items() if value is not None}
+        if not active:
+            return TicketService.TOTAL_COUNT_KEY
+        return tuple(sorted(active.items()))
+
+    @staticmethod
+    def _next_change_seq() -> int:
+        """Take the change sequence number for the current write transaction
+
+        The counter row stays locked until commit, so numbers become visible
+        in commit order and the change feed never skips past a write that
+        commits late. Call it only once the transaction has changed tickets,
+        as its last lock: after the ticket and event_stats rows, before
+        tombstones. Writers then hold the one global row only for the end of
+        their transaction, and redeems that change nothing never take it.
+        All rows a transaction touches share its number.
+        """
+        stmt = (
+            update(TicketSyncState)
+            .where(TicketSyncState.id == TicketSyncState.ROW_ID)
+            .values(change_seq=TicketSyncState.change_seq + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if db.engine.dialect.update_returning:
+            return db.session.execute(stmt.returning(TicketSyncState.change_seq)).scalar_one()
+        db.session.execute(stmt)
+        return db.session.execute(
+            select(TicketSyncState.change_seq).where(TicketSyncState.id == TicketSyncState.ROW_ID)
+        ).scalar_one()
+
+    @staticmethod
+    def _stamp_change_seq(ticket_ids: List[int]):
+        """Take the change sequence number and stamp it on tickets already updated
+
+        updated_at is kept as is, so the stamp does not change the ETag.
+        """
+        change_seq = TicketService._next_change_seq()
+        db.session.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(ticket_ids))
+            .values(change_seq=change_seq, updated_at=Ticket.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _write_tombstones(ticket_ids: List[int], change_seq: int):
+        """Record removed tickets for the change feed, replacing older markers"""
+        db.session.execute(
+            delete(TicketTombstone).where(TicketTombstone.ticket_id.in_(ticket_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.execute(insert(TicketTombstone), [
+            {'ticket_id': ticket_id, 'change_seq': change_seq} for ticket_id in ticket_ids
+        ])
+
+    @staticmethod
+    def _tickets_changed(ticket_ids, total_delta: int = 0):
+        """Invalidate cached payloads and counts after a committed write"""
+        ticket_cache.invalidate(*ticket_ids)
+        if total_delta:
+            count_cache.adjust(TicketService.TOTAL_COUNT_KEY, total_delta)
+        # Filtered counts cannot be adjusted blindly; drop them instead
+        count_cache.invalidate_matching(lambda key: key != TicketService.TOTAL_COUNT_KEY)
+
+    @staticmethod
+    def count_tickets(filters: Optional[Dict[str, Any]] = None) -> int:
+        """Get the number of matching tickets, served from a short-TTL cache
+
+        Writes adjust the unfiltered total in place and drop filtered counts,
+        so both stay exact within this process; other processes converge once
+        the TTL expires. Counts read from a lagging replica are not cached.
+        """
+        key = TicketService._count_key(filters)
+        found, total = count_cache.get(key)
+        if found:
+            return total
+
+        epoch = count_cache.cache.epoch
+        try:
+            stmt = select(func.count()).select_from(Ticket)
+            if any((filters or {}).get(name) is not None for name in TicketService.EVENT_FILTERS):
+                stmt = stmt.join(Event, Ticket.event_id == Event.id)
+            stmt = TicketService.apply_filters(stmt, filters)
+            total = db.session.execute(stmt).scalar_one()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+        if not reading_from_replica():
+            count_cache.set(key, total, epoch)
+        return total
+
     @staticmethod
-    def get_all_tickets(page: int = 1, per_page: int = 10):
-        """Get all tickets with pagination"""
+    def get_ticket_page(page: int = 1, per_page: int = 10, include_total: bool = True,
+                        filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get a page of tickets as API dicts, without building ORM entities
+
+        Selects the ticket columns as Core rows and serializes them directly,
+        skipping identity-map bookkeeping and attribute instrumentation. With
+        include_total=False no count is run at all; total and pages are None.
+        """
+        # Same lenient bounds as paginate(error_out=False)
+        page = max(page, 1)
+        if per_page < 1:
+            per_page = 20
         try:
-            return Ticket.query.order_by(Ticket.created_at.desc()).paginate(
-                page=page, per_page=per_page, error_out=False
+            total = TicketService.count_tickets(filters) if include_total else None
+            # Without a total, fetch one extra row to find out about a next page
+            limit = per_page if include_total else per_page + 1
+            rows = db.session.execute(
+                TicketService.build_list_statement(filters)
+                .limit(limit)
+                .offset((page - 1) * per_page)
+            ).mappings().all()
+
+            if include_total:
+                pages = math.ceil(total / per_page) if total else 0
+                has_next = page < pages
+            else:
+                pages = None
+                has_next = len(rows) > per_page
+                rows = rows[:per_page]
+
+            return {
+                'items': [Ticket.row_to_dict(row) for row in rows],
+                'page': page,
+                'pages': pages,
+                'per_page': per_page,
+                'total': total,
+                'has_next': has_next,
+                'has_prev': page > 1
+            }
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def get_tickets_by_cursor(cursor: Optional[str] = None, limit: int = 10,
+                              filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get a page of tickets by seeking on (created_at, id) instead of OFFSET"""
+        try:
+            stmt = TicketService.apply_filters(TicketService.select_rows(), filters)
+            direction = 'next'
+            if cursor:
+                created_at, ticket_id, direction = decode_cursor(cursor)
+                position = tuple_(Ticket.created_at, Ticket.id)
+                if direction == 'next':
+                    stmt = stmt.where(position < tuple_(created_at, ticket_id))
+                else:
+                    stmt = stmt.where(position > tuple_(created_at, ticket_id))
+
+            if direction == 'next':
+                stmt = stmt.order_by(Ticket.created_at.desc(), Ticket.id.desc())
+            else:
+                stmt = stmt.order_by(Ticket.created_at.asc(), Ticket.id.asc())
+
+            # Fetch one extra row to find out whether another page exists
+            rows = db.session.execute(stmt.limit(limit + 1)).mappings().all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+            if direction == 'next':
+                has_next, has_prev = has_more, bool(cursor)
+            else:
+                rows.reverse()
+                has_next, has_prev = True, has_more
+
+            next_cursor = None
+            prev_cursor = None
+            if rows and has_next:
+                next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id'], 'next')
+            if rows and has_prev:
+                prev_cursor = encode_cursor(rows[0]['created_at'], rows[0]['id'], 'prev')
+
+            return {
+                'items': [Ticket.row_to_dict(row) for row in rows],
+                'limit': limit,
+                'has_next': has_next,
+                'has_prev': has_prev,
+                'next_cursor': next_cursor,
+                'prev_cursor': prev_cursor
+            }
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def _ranked_events(terms: List[str]):
+        """Subquery of the events matching every term, as (id, rank), lower rank first
+
+        SQLite ranks with FTS5's bm25, PostgreSQL with ts_rank (negated so
+        both sort ascending), and the LIKE fallback gives every match rank 0.
+        """
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite':
+            match = ' '.join(f'"{term}"*' for term in terms)
+            return text(
+                'SELECT rowid AS id, rank FROM events_fts WHERE events_fts MATCH :match'
+            ).bindparams(match=match).columns(id=Integer, rank=Float).subquery('ranked_events')
+        if dialect == 'postgresql':
+            vector = literal_column(POSTGRES_SEARCH_VECTOR)
+            tsquery = func.to_tsquery(literal_column("'simple'"), ' & '.join(f'{term}:*' for term in terms))
+            return (
+                select(Event.id, (-func.ts_rank(vector, tsquery)).label('rank'))
+                .where(vector.op('@@')(tsquery))
+                .subquery('ranked_events')
             )
+        stmt = select(Event.id, literal(0.0, Float).label('rank'))
+        for term in terms:
+            pattern = f'%{term}%'
+            stmt = stmt.where(or_(Event.name.ilike(pattern), Event.location.ilike(pattern)))
+        return stmt.subquery('ranked_events')
+
+    @staticmethod
+    def search_tickets(query: str, per_page: int = 10, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Full-text search over event names and locations, best matches first
+
+        Every word in the query must match the start of a word in the event
+        name or location. SQLite uses the FTS5 index and PostgreSQL the
+        tsvector GIN index, both over events; other backends fall back to an
+        unindexed LIKE. Results are ordered by (rank, event_id, created_at,
+        id): matching events are paged in rank order, and each one's tickets
+        are read with a keyset seek on ix_tickets_event_id_created_at, so a
+        page reads about per_page tickets however many events match.
+        """
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            raise ValueError('Search query must contain at least one word')
+
+        per_page = max(per_page, 1)
+        ranked = TicketService._ranked_events(terms)
+        position = None
+        # (rank, event_id, row) for up to per_page + 1 tickets
+        matches = []
+
+        def read_event(rank, event_id, after=None):
+            stmt = TicketService.select_rows().where(Ticket.event_id == event_id)
+            if after:
+                stmt = stmt.where(tuple_(Ticket.created_at, Ticket.id) > tuple_(*after))
+            stmt = stmt.order_by(Ticket.created_at, Ticket.id).limit(per_page + 1 - len(matches))
+            matches.extend((rank, event_id, row) for row in db.session.execute(stmt).mappings())
+
+        try:
+            if cursor:
+                rank, event_id, created_at, ticket_id = decode_search_cursor(cursor)
+                # The rest of the event the previous page stopped in
+                read_event(rank, event_id, (created_at, ticket_id))
+                position = (rank, event_id)
+
+            while len(matches) <= per_page:
+                stmt = select(ranked.c.id, ranked.c.rank)
+                if position:
+                    stmt = stmt.where(or_(
+                        ranked.c.rank > position[0],
+                        (ranked.c.rank == position[0]) & (ranked.c.id > position[1])
+                    ))
+                events = db.session.execute(
+                    stmt.order_by(ranked.c.rank, ranked.c.id).limit(per_page + 1)
+                ).all()
+                for event_id, rank in events:
+                    read_event(rank, event_id)
+                    if len(matches) > per_page:
+                        break
+                if len(events) <= per_page:
+                    break
+                position = (events[-1].rank, events[-1].id)
+
+            has_next = len(matches) > per_page
+            matches = matches[:per_page]
+            next_cursor = None
+            if has_next:
+                rank, event_id, row = matches[-1]
+                next_cursor = encode_search_cursor(rank, event_id, row['created_at'], row['id'])
+
+            return {
+                'items': [Ticket.row_to_dict(row) for _, _, row in matches],
+                'per_page': per_page,
+                'has_next': has_next,
+                'next_cursor': next_cursor
+            }
         except SQLAlchemyError as e:
             raise Exception(f"Database error: {str(e)}")
 
     @staticmethod
-    def get_ticket_by_id(ticket_id: int) -> Optional[Ticket]:
-        """Get a ticket by ID"""
+    def get_ticket_by_id(ticket_id: int) -> Optional[Union[Ticket, TicketArchive]]:
+        """Get a ticket by ID, falling through to the archive for past events"""
         try:
-            return Ticket.query.get(ticket_id)
+            return Ticket.query.get(ticket_id) or db.session.get(TicketArchive, ticket_id)
         except SQLAlchemyError as e:
             raise Exception(f"Database error: {str(e)}")
 
+    @staticmethod
+    def iter_ticket_dicts(batch_size: int = 1000,
+                          filters: Optional[Dict[str, Any]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield all tickets as API dicts in batches, streaming from the database
+
+        Uses a server-side cursor where the driver supports it and never builds
+        ORM entities, so memory stays flat regardless of table size.
+        """
+        stmt = (
+            TicketService.apply_filters(TicketService.select_rows(), filters)
+            .order_by(Ticket.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        try:
+            result = db.session.execute(stmt).mappings()
+            for partition in result.partitions(batch_size):
+                yield [Ticket.row_to_dict(row) for row in partition]
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def get_ticket_changes(token: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Get tickets created, updated or deleted after a sync token, in change order
+
+        Live tickets and tombstones are read with keyset seeks on
+        (change_seq, id) and merged. Both reads stop at the counter value read
+        first: every number up to it belongs to a committed write, so no
+        change can commit behind the returned token. Without a token the
+        whole table is listed; tombstones up to that point are skipped, since
+        the client held none of those tickets. Raises SyncTokenExpiredError
+        when tombstones the client still needs have been purged.
+        """
+        try:
+            high_water, floor = db.session.execute(
+                select(TicketSyncState.change_seq, TicketSyncState.tombstone_floor)
+                .where(TicketSyncState.id == TicketSyncState.ROW_ID)
+            ).one()
+            if token:
+                change_seq, ticket_id, tombstones_after = decode_sync_token(token)
+            else:
+                change_seq, ticket_id, tombstones_after = 0, 0, high_water
+            # Purged tombstones are those with change_seq <= floor
+            if tombstones_after < floor and change_seq <= floor:
+                raise SyncTokenExpiredError('Sync token has expired; sync again without a token')
+            position = tuple_(change_seq, ticket_id)
+
+            rows = db.session.execute(
+                TicketService.select_rows()
+                .add_columns(Ticket.change_seq)
+                .where(Ticket.change_seq <= high_water, tuple_(Ticket.change_seq, Ticket.id) > position)
+                .order_by(Ticket.change_seq, Ticket.id)
+                .limit(limit + 1)
+            ).mappings().all()
+            changes = [(row['change_seq'], row['id'], row) for row in rows]
+            if tombstones_after < high_water:
+                tombstones = db.session.execute(
+                    select(TicketTombstone.change_seq, TicketTombstone.ticket_id)
+                    .where(
+                        TicketTombstone.change_seq <= high_water,
+                        TicketTombstone.change_seq > tombstones_after,
+                        tuple_(TicketTombstone.change_seq, TicketTombstone.ticket_id) > position
+                    )
+                    .order_by(TicketTombstone.change_seq, TicketTombstone.ticket_id)
+                    .limit(limit + 1)
+                ).all()
+                changes.extend((seq, deleted_id, None) for seq, deleted_id in tombstones)
+                changes.sort(key=lambda change: change[:2])
+
+            has_more = len(changes) > limit
+            changes = changes[:limit]
+            if changes:
+                next_token = encode_sync_token(changes[-1][0], changes[-1][1], tombstones_after)
+            else:
+                next_token = token or encode_sync_token(high_water, 0, tombstones_after)
+
+            return {
+                'changes': [
+                    {'op': 'upsert', 'id': changed_id, 'ticket': Ticket.row_to_dict(row)} if row is not None
+                    else {'op': 'delete', 'id': changed_id}
+                    for _, changed_id, row in changes
+                ],
+                'next_token': next_token,
+                'has_more': has_more
+            }
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def get_ticket_updated_at(ticket_id: int) -> Optional[datetime]:
+        """Get only a ticket's updated_at, without loading the model"""
+        try:
+            updated_at = db.session.execute(
+                select(Ticket.updated_at).where(Ticket.id == ticket_id)
+            ).scalar_one_or_none()
+            if updated_at is None:
+                updated_at = db.session.execute(
+                    select(TicketArchive.updated_at).where(TicketArchive.id == ticket_id)
+                ).scalar_one_or_none()
+            return updated_at
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    @staticmethod
+    def get_ticket_dict(ticket_id: int) -> Optional[Dict[str, Any]]:
+        """Get a serialized ticket by ID, read through the in-process cache"""
+        found, payload = ticket_cache.get(ticket_id)
+        if found:
+            return payload
+
+        epoch = ticket_cache.cache.epoch
+        ticket = TicketService.get_ticket_by_id(ticket_id)
+        payload = ticket.to_dict() if ticket else None
+        # Misses are cached too, so creation must invalidate its new ID.
+        # Replica reads may lag behind a write that already invalidated the
+        # entry, and the cache also serves read-your-writes requests, so only
+        # primary reads are cached
+        if not reading_from_replica():
+            ticket_cache.set(ticket_id, payload, epoch)
+        return payload
+
+    @staticmethod
+    def group_commit_writer() -> Optional[BatchWriter]:
+        """The app's group-commit writer, started on first use; None when disabled"""
+        app = current_app._get_current_object()
+        if not app.config.get('TICKET_GROUP_COMMIT'):
+            return None
+        writer = app.extensions.get('ticket_group_commit')
+        if writer is None or not writer.alive:
+            with TicketService._writer_lock:
+                writer = app.extensions.get('ticket_group_commit')
+                if writer is None or not writer.alive:
+                    max_rows = app.config['TICKET_GROUP_COMMIT_MAX_ROWS']
+                    writer = app.extensions['ticket_group_commit'] = BatchWriter(
+                        app,
+                        lambda items: TicketService.create_tickets_bulk(items, chunk_size=max_rows),
+                        window_ms=app.config['TICKET_GROUP_COMMIT_WINDOW_MS'],
+                        max_rows=max_rows
+                    )
+        return writer
+
     @staticmethod
     def create_ticket(ticket_data: Dict[str, Any]) -> Ticket:
-        """Create a new ticket"""
+        """Create a new ticket
+
+        With TICKET_GROUP_COMMIT enabled the insert is handed to the
+        background writer, which commits concurrent creates together; this
+        call still returns only after the ticket's transaction has committed.
+        """
+        writer = TicketService.group_commit_writer()
+        if writer is not None:
+            future = writer.submit(ticket_data)
+            try:
+                ticket_id = future.result(timeout=current_app.config['TICKET_GROUP_COMMIT_TIMEOUT'])
+            except FutureTimeoutError:
+                # Withdraw the queued insert so a retry cannot duplicate it.
+                # Once its batch is running it can only be waited for.
+                if future.cancel():
+                    raise Exception("Failed to create ticket: timed out waiting for group commit")
+                ticket_id = future.result()
+            return db.session.get(Ticket, ticket_id)
+
         try:
-            ticket = Ticket(
-                event_name=ticket_data['eventName'],
-                location=ticket_data['location'],
-                time=ticket_data['time']
-            )
+            key = EventService.event_key(ticket_data['eventName'], ticket_data['location'], ticket_data['time'])
+            event_id = EventService.resolve_event_ids([key])[key]
+            EventStatsService.adjust({ticket_data['eventName']: (1, 0)})
+            ticket = Ticket(event_id=event_id, change_seq=TicketService._next_change_seq())
             db.session.add(ticket)
             db.session.commit()
+            TicketService._tickets_changed([ticket.id], total_delta=1)
             return ticket
         except SQLAlchemyError as e:
             db.session.rollback()
             raise Exception(f"Failed to create ticket: {str(e)}")
 
+    @staticmethod
+    def create_tickets_bulk(tickets_data: List[Dict[str, Any]], chunk_size: int = 1000) -> List[int]:
+        """Create many tickets in one transaction and return their IDs in input order
+
+        Each distinct event is looked up or created once for the whole batch.
+        """
+        keys = [
+            EventService.event_key(data['eventName'], data['location'], data['time'])
+            for data in tickets_data
+        ]
+        try:
+            event_ids = EventService.resolve_event_ids(keys)
+            EventStatsService.adjust(EventStatsService.deltas(
+                (name, 1, 0) for name, _, _ in keys
+            ))
+            change_seq = TicketService._next_change_seq()
+            rows = [{'event_id': event_ids[key], 'change_seq': change_seq} for key in keys]
+            ids = []
+            dialect = db.engine.dialect
+            if dialect.name == 'sqlite' and dialect.insert_executemany_returning:
+                # SQLAlchemy degrades sort_by_parameter_order to one INSERT per
+                # row on SQLite. Rowids within one multi-row INSERT are
+                # allocated in VALUES order, so sorting the IDs restores it.
+                stmt = insert(Ticket).returning(Ticket.id)
+                for start in range(0, len(rows), chunk_size):
+                    result = db.session.execute(stmt, rows[start:start + chunk_size])
+                    ids.extend(sorted(result.scalars().all()))
+            elif dialect.insert_executemany_returning_sort_by_parameter_order:
+                stmt = insert(Ticket).returning(Ticket.id, sort_by_parameter_order=True)
+                for start in range(0, len(rows), chunk_size):
+                    result = db.session.execute(stmt, rows[start:start + chunk_size])
+                    ids.extend(result.scalars().all())
+            else:
+                # Backends without executemany RETURNING: one statement per row,
+                # still a single transaction and a single commit
+                for row in rows:
+                    result = db.session.execute(insert(Ticket), row)
+                    ids.append(result.inserted_primary_key[0])
+            db.session.commit()
+            TicketService._tickets_changed(ids, total_delta=len(ids))
+            return ids
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to create tickets: {str(e)}")
+
+    @staticmethod
+    def redeem_ticket(ticket_id: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Atomically mark an unused ticket as used with one conditional UPDATE
+
+        Returns the outcome and, when redeemed, the ticket as a dict. The ORM
+        entity is never loaded, so two concurrent scans cannot both succeed;
+        the event fields come from the event cache. Scans that change nothing
+        do not touch the change-feed counter.
+        """
+        columns = Ticket.__table__.c
+        stmt = (
+            update(Ticket)
+            .where(Ticket.id == ticket_id, Ticket.is_used == False)  # noqa: E712
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            stmt = stmt.values(is_used=True)
+            if db.engine.dialect.update_returning:
+                row = db.session.execute(stmt.returning(*columns)).mappings().first()
+            else:
+                result = db.session.execute(stmt)
+                row = None
+                if result.rowcount:
+                    row = db.session.execute(
+                        select(*columns).where(Ticket.id == ticket_id)
+                    ).mappings().first()
+
+            if row is None:
+                # Only the losing path pays for a second lookup
+                exists = db.session.execute(
+                    select(Ticket.id).where(Ticket.id == ticket_id)
+                ).first()
+                db.session.commit()
+                if exists:
+                    return TicketService.ALREADY_USED, None
+                return TicketService.NOT_FOUND, None
+
+            row = {**row, **EventService.get_event_row(row['event_id'])}
+            EventStatsService.adjust({row['event_name']: (0, 1)})
+            TicketService._stamp_change_seq([ticket_id])
+            db.session.commit()
+            TicketService._tickets_changed([ticket_id])
+            return TicketService.REDEEMED, Ticket.row_to_dict(row)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to redeem ticket: {str(e)}")
+
+    @staticmethod
+    def redeem_tickets(ticket_ids: List[int]) -> Dict[int, str]:
+        """Redeem many tickets with one set-based conditional UPDATE
+
+        Returns the outcome for each distinct ID: redeemed, already_used or
+        not_found. Everything runs in a single transaction.
+        """
+        unique_ids = list(dict.fromkeys(ticket_ids))
+        stmt = (
+            update(Ticket)
+            .where(Ticket.id.in_(unique_ids), Ticket.is_used == False)  # noqa: E712
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            stmt = stmt.values(is_used=True)
+            if db.engine.dialect.update_returning:
+                rows = db.session.execute(stmt.returning(Ticket.id, Ticket.event_id)).all()
+            else:
+                # Lock the unused rows first so the UPDATE affects exactly these
+                rows = db.session.execute(
+                    select(Ticket.id, Ticket.event_id)
+                    .where(Ticket.id.in_(unique_ids), Ticket.is_used == False)  # noqa: E712
+                    .with_for_update()
+                ).all()
+                if rows:
+                    db.session.execute(stmt.where(Ticket.id.in_([row.id for row in rows])))
+            redeemed = {row.id for row in rows}
+            events = EventService.get_event_rows(row.event_id for row in rows)
+            EventStatsService.adjust(EventStatsService.deltas(
+                (events[row.event_id]['event_name'], 0, 1) for row in rows
+            ))
+            if redeemed:
+                TicketService._stamp_change_seq(list(redeemed))
+
+            remaining = [ticket_id for ticket_id in unique_ids if ticket_id not in redeemed]
+            existing = set()
+            if remaining:
+                existing = set(db.session.execute(
+                    select(Ticket.id).where(Ticket.id.in_(remaining))
+                ).scalars())
+            db.session.commit()
+            TicketService._tickets_changed(redeemed)
+
+            outcomes = {}
+            for ticket_id in unique_ids:
+                if ticket_id in redeemed:
+                    outcomes[ticket_id] = TicketService.REDEEMED
+                elif ticket_id in existing:
+                    outcomes[ticket_id] = TicketService.ALREADY_USED
+                else:
+                    outcomes[ticket_id] = TicketService.NOT_FOUND
+            return outcomes
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to redeem tickets: {str(e)}")
+
     @staticmethod
     def mark_ticket_as_used(ticket_id: int, is_used: bool) -> Optional[Ticket]:
         """Mark a ticket as used or unused"""
@@ -49,23 +711,123 @@ class TicketService:
             if not ticket:
                 return None
 
-            ticket.is_used = is_used
+            if ticket.is_used != is_used:
+                ticket.is_used = is_used
+                db.session.flush()
+                EventStatsService.adjust({ticket.event_name: (0, 1 if is_used else -1)})
+                TicketService._stamp_change_seq([ticket_id])
             db.session.commit()
+            TicketService._tickets_changed([ticket_id])
             return ticket
         except SQLAlchemyError as e:
             db.session.rollback()
             raise Exception(f"Failed to update ticket: {str(e)}")
 
+    @staticmethod
+    def archive_past_tickets(before: datetime, chunk_size: int = 1000,
+                             max_chunks: Optional[int] = None) -> int:
+        """Move tickets for events before `before` to tickets_archive in chunks
+
+        Each chunk is copied and deleted in its own short transaction, so the
+        hot table is never locked for long. Returns the number of tickets
+        moved.
+        """
+        columns = [column.key for column in TicketService.select_rows().selected_columns] + ['archived_at']
+        moved = 0
+        chunks = 0
+        try:
+            while max_chunks is None or chunks < max_chunks:
+                ids = db.session.execute(
+                    select(Ticket.id)
+                    .join(Event, Ticket.event_id == Event.id)
+                    .where(Event.time < before)
+                    .order_by(Ticket.id)
+                    .limit(chunk_size)
+                ).scalars().all()
+                if not ids:
+                    break
+
+                db.session.execute(
+                    insert(TicketArchive).from_select(
+                        columns,
+                        TicketService.select_rows()
+                        .add_columns(literal(datetime.utcnow()))
+                        .where(Ticket.id.in_(ids))
+                    )
+                )
+                db.session.execute(
+                    delete(Ticket).where(Ticket.id.in_(ids))
+                    .execution_options(synchronize_session=False)
+                )
+                # Synced devices drop archived tickets like deleted ones
+                TicketService._write_tombstones(ids, TicketService._next_change_seq())
+                db.session.commit()
+                TicketService._tickets_changed(ids, total_delta=-len(ids))
+                moved += len(ids)
+                chunks += 1
+            return moved
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to archive tickets: {str(e)}")
+
+    @staticmethod
+    def purge_tombstones(older_than: datetime) -> int:
+        """Delete tombstones written before `older_than` and return how many
+
+        Raises the token floor to the newest purged sequence number, so
+        clients holding an older token are told to sync again from scratch
+        instead of silently missing deletes.
+        """
+        try:
+            floor = db.session.execute(
+                select(func.max(TicketTombstone.change_seq))
+                .where(TicketTombstone.deleted_at < older_than)
+            ).scalar()
+            if floor is None:
+                return 0
+            # Counter row before tombstones, the order writers lock them in
+            db.session.execute(
+                update(TicketSyncState)
+                .where(TicketSyncState.id == TicketSyncState.ROW_ID, TicketSyncState.tombstone_floor < floor)
+                .values(tombstone_floor=floor)
+                .execution_options(synchronize_session=False)
+            )
+            result = db.session.execute(
+                delete(TicketTombstone).where(TicketTombstone.change_seq <= floor)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            raise Exception(f"Failed to purge tombstones: {str(e)}")
+
     @staticmethod
     def delete_ticket(ticket_id: int) -> bool:
-        """Delete a ticket"""
+        """Delete a ticket, live or archived
+
+        Live tickets leave a tombstone for the change feed; archived ones got
+        theirs when they were archived.
+        """
         try:
             ticket = Ticket.query.get(ticket_id)
             if not ticket:
-                return False
+                archived = db.session.get(TicketArchive, ticket_id)
+                if not archived:
+                    return False
+                EventStatsService.adjust({archived.event_name: (-1, -1 if archived.is_used else 0)})
+                db.session.delete(archived)
+                db.session.commit()
+                ticket_cache.invalidate(ticket_id)
+                return True
 
+            event_name, is_used = ticket.event_name, ticket.is_used
             db.session.delete(ticket)
+            db.session.flush()
+            EventStatsService.adjust({event_name: (-1, -1 if is_used else 0)})
+            TicketService._write_tombstones([ticket_id], TicketService._next_change_seq())
             db.session.commit()
+            TicketService._tickets_changed([ticket_id], total_delta=-1)
             return True
         except SQLAlchemyError as e:
             db.session.rollback()
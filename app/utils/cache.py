@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+from flask import Flask, current_app
+
+
+class LRUTTLCache:
+    """Thread-safe LRU cache whose entries also expire after a TTL"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; lets read-through callers detect that
+        # a write happened while they were loading from the database
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value); expired entries count as misses"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: Hashable, value: Any, epoch: int = None):
+        """Store a value; skipped if an invalidation happened since `epoch`"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def adjust(self, key: Hashable, delta: int):
+        """Add `delta` to a cached numeric value in place, keeping its expiry"""
+        with self._lock:
+            self._epoch += 1
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                self._data[key] = (expires_at, value + delta)
+
+    def invalidate(self, *keys: Hashable):
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]):
+        """Drop every entry whose key satisfies `predicate`"""
+        with self._lock:
+            self._epoch += 1
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+class AppCache:
+    """Flask extension holding a per-app LRUTTLCache sized from config"""
+
+    def __init__(self, name: str, size_key: str, ttl_key: str,
+                 default_size: int = 1024, default_ttl: float = 30.0, app: Flask = None):
+        self.name = name
+        self.size_key = size_key
+        self.ttl_key = ttl_key
+        self.default_size = default_size
+        self.default_ttl = default_ttl
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        app.extensions[self.name] = LRUTTLCache(
+            maxsize=app.config.get(self.size_key, self.default_size),
+            ttl=app.config.get(self.ttl_key, self.default_ttl)
+        )
+
+    @property
+    def cache(self) -> LRUTTLCache:
+        return current_app.extensions[self.name]
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        return self.cache.get(key)
+
+    def set(self, key: Hashable, value: Any, epoch: int = None):
+        self.cache.set(key, value, epoch)
+
+    def adjust(self, key: Hashable, delta: int):
+        self.cache.adjust(key, delta)
+
+    def invalidate(self, *keys: Hashable):
+        self.cache.invalidate(*keys)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]):
+        self.cache.invalidate_matching(predicate)
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
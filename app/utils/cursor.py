@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, ticket_id: int, direction: str = 'next') -> str:
+    """Encode a keyset position into an opaque, URL-safe cursor"""
+    payload = json.dumps(
+        {'c': created_at.isoformat(), 'i': ticket_id, 'd': direction},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int, str]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction = payload.get('d', 'next')
+        if direction not in ('next', 'prev'):
+            raise ValueError(direction)
+        return datetime.fromisoformat(payload['c']), int(payload['i']), direction
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+
+def encode_sync_token(change_seq: int, ticket_id: int, tombstones_after: int) -> str:
+    """Encode a change feed position into an opaque, URL-safe token
+
+    tombstones_after is the sequence number at or below which the client
+    needs no deletes: where its full sync started.
+    """
+    payload = json.dumps({'s': change_seq, 'i': ticket_id, 't': tombstones_after}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_sync_token(token: str) -> Tuple[int, int, int]:
+    """Decode a token produced by encode_sync_token"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(payload['s']), int(payload['i']), int(payload['t'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError('Invalid sync token') from e
+
+
+def encode_search_cursor(rank: float, event_id: int, created_at: datetime, ticket_id: int) -> str:
+    """Encode a search result position into an opaque, URL-safe cursor"""
+    payload = json.dumps(
+        {'r': rank, 'e': event_id, 'c': created_at.isoformat(), 'i': ticket_id},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int, datetime, int]:
+    """Decode a cursor produced by encode_search_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (float(payload['r']), int(payload['e']),
+                datetime.fromisoformat(payload['c']), int(payload['i']))
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
@@ -0,0 +1,118 @@
+"""Swagger documentation wiring
+
+Routes are annotated with `swag_from`, which only records the YAML path on
+the view function (the same attributes Flasgger reads). Flasgger itself is
+imported by `init_docs` only when SWAGGER_ENABLED is set, and the YAML files
+are read when the spec is first requested.
+
+The spec is compiled to JSON once (or loaded from SWAGGER_SPEC_FILE, written
+by `flask build-apispec`) and served from memory with an ETag.
+"""
+
+import json
+import os
+import sys
+from flask import Flask, Response, request
+from app.utils.etag import make_etag
+
+SPEC_ENDPOINT = 'apispec_1'
+
+SWAGGER_TEMPLATE = {
+    "swagger": "2.0",
+    "info": {
+        "title": "TicketQ API",
+        "description": "Simple Ticket Management API",
+        "version": "1.0.0",
+        "contact": {
+            "name": "TicketQ API Support",
+            # "email": "support@ticketq.com"
+        }
+    },
+    "basePath": "/",
+    "schemes": ["http"],
+    "consumes": ["application/json"],
+    "produces": ["application/json"],
+    "tags": [
+        {
+            "name": "Tickets",
+            "description": "Ticket management operations"
+        },
+        {
+            "name": "Events",
+            "description": "Per-event ticket statistics"
+        }
+    ]
+}
+
+SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": 'apispec_1',
+            "route": '/apispec_1.json',
+            "rule_filter": lambda rule: True,
+            "model_filter": lambda tag: True,
+        }
+    ],
+    "static_url_path": "/flasgger_static",
+    "swagger_ui": True,
+    "specs_route": "/apidocs/"
+}
+
+
+def swag_from(path: str):
+    """Attach a YAML spec file to a view without importing Flasgger"""
+    def decorator(function):
+        root = os.path.dirname(os.path.abspath(sys.modules[function.__module__].__file__))
+        function.swag_path = os.path.normpath(os.path.join(root, path))
+        function.swag_type = path.rsplit('.', 1)[-1]
+        return function
+    return decorator
+
+
+def init_docs(app: Flask):
+    """Register Flasgger's UI and spec routes when SWAGGER_ENABLED is set"""
+    if not app.config.get('SWAGGER_ENABLED', False):
+        return None
+
+    from flasgger import Swagger
+    swagger = Swagger(app, config=SWAGGER_CONFIG, template=SWAGGER_TEMPLATE)
+
+    spec_file = app.config.get('SWAGGER_SPEC_FILE')
+    if spec_file and os.path.exists(spec_file):
+        with open(spec_file, 'rb') as f:
+            _store_spec(app, f.read())
+
+    app.view_functions[f'flasgger.{SPEC_ENDPOINT}'] = _spec_view(app)
+    return swagger
+
+
+def compile_spec(app: Flask) -> bytes:
+    """Render the Swagger spec from the route YAML files to compact JSON"""
+    with app.app_context():
+        spec = app.swag.get_apispecs(SPEC_ENDPOINT)
+    return json.dumps(spec, separators=(',', ':')).encode()
+
+
+def _store_spec(app: Flask, body: bytes):
+    app.extensions['apispec'] = (body, make_etag('apispec', body.decode()))
+    return app.extensions['apispec']
+
+
+def _spec_view(app: Flask):
+    def apispec():
+        """Serve the compiled spec; in debug mode it is rebuilt on every request"""
+        compiled = app.extensions.get('apispec')
+        if compiled is None or (app.debug and not app.config.get('SWAGGER_SPEC_FILE')):
+            compiled = _store_spec(app, compile_spec(app))
+        body, etag = compiled
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    return apispec
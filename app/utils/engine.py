@@ -0,0 +1,74 @@
+from typing import Any, Dict
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+
+def resolve_engine_profile(app: Flask) -> str:
+    """Pick the engine profile: explicit DB_ENGINE_PROFILE, or from the URI"""
+    profile = app.config.get('DB_ENGINE_PROFILE', 'auto')
+    if profile != 'auto':
+        return profile
+    backend = make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name()
+    return 'sqlite' if backend == 'sqlite' else 'server'
+
+
+def server_engine_options(config) -> Dict[str, Any]:
+    """Connection pool settings for PostgreSQL/MySQL-style servers"""
+    return {
+        'pool_size': config.get('DB_POOL_SIZE', 10),
+        'max_overflow': config.get('DB_MAX_OVERFLOW', 20),
+        'pool_timeout': config.get('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': config.get('DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': config.get('DB_POOL_PRE_PING', True),
+    }
+
+
+def sqlite_pragmas(config) -> Dict[str, Any]:
+    """PRAGMAs applied to every new SQLite connection"""
+    return {
+        'journal_mode': config.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': config.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'busy_timeout': config.get('SQLITE_BUSY_TIMEOUT_MS', 5000),
+        'mmap_size': config.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024),
+        'cache_size': config.get('SQLITE_CACHE_SIZE', -64000),
+        'temp_store': 'MEMORY',
+    }
+
+
+def apply_engine_profile(app: Flask):
+    """Fill SQLALCHEMY_ENGINE_OPTIONS from the profile; call before db.init_app
+
+    Options set explicitly in the config win over the profile defaults.
+    """
+    profile = resolve_engine_profile(app)
+    app.config['DB_ENGINE_PROFILE_ACTIVE'] = profile
+    if profile == 'server':
+        options = server_engine_options(app.config)
+        options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]):
+    """Run the PRAGMAs on each new DBAPI connection of a SQLite engine"""
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+
+
+def configure_engines(app: Flask, db):
+    """Attach profile-specific engine hooks; call after db.init_app"""
+    if app.config.get('DB_ENGINE_PROFILE_ACTIVE') != 'sqlite':
+        return
+    pragmas = sqlite_pragmas(app.config)
+    with app.app_context():
+        for engine in db.engines.values():
+            install_sqlite_pragmas(engine, pragmas)
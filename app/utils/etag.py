@@ -0,0 +1,12 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag value (without quotes) from the given parts"""
+    raw = ':'.join(str(part) for part in parts)
+    return hashlib.sha1(raw.encode()).hexdigest()[:32]
+
+
+def ticket_etag(ticket_id: int, updated_at: str) -> str:
+    """ETag for a single ticket; `updated_at` is the ISO string the API returns"""
+    return make_etag('ticket', ticket_id, updated_at)
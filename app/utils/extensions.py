@@ -1,5 +1,29 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from app.utils.cache import AppCache
+from app.utils.metrics import RequestMetrics
+from app.utils.replica import ReadReplica, RoutingSession
 
-db = SQLAlchemy()
-migrate = Migrate()
\ No newline at end of file
+# RoutingSession sends reads to the replica bind when a request selected it
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+migrate = Migrate()
+# Serialized ticket payloads for GET /tickets/<id>
+ticket_cache = AppCache(
+    'ticket_cache', 'TICKET_CACHE_SIZE', 'TICKET_CACHE_TTL',
+    default_size=10000, default_ttl=30
+)
+# Total counts for paginated listing
+count_cache = AppCache(
+    'ticket_count_cache', 'TICKET_COUNT_CACHE_SIZE', 'TICKET_COUNT_CACHE_TTL',
+    default_size=256, default_ttl=5
+)
+# Event rows by ID and IDs by (name, location, time); events never change
+event_cache = AppCache(
+    'event_cache', 'EVENT_CACHE_SIZE', 'EVENT_CACHE_TTL',
+    default_size=10000, default_ttl=300
+)
+
+# Per-request timing, SQL counts and /metrics
+metrics = RequestMetrics()
+# Replica health and read-your-writes for GET routes
+read_replica = ReadReplica()
@@ -0,0 +1,85 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+from flask import Flask
+
+
+class BatchWriter:
+    """Background thread that flushes queued items in batches
+
+    submit() returns a Future. The writer collects items until `max_rows` are
+    queued or `window_ms` has passed since the first one, then calls
+    `flush(items)` inside an app context and resolves each future with the
+    matching entry of the returned list (or fails them all with its error).
+    Items whose future was cancelled before their batch started are dropped.
+    """
+
+    def __init__(self, app: Flask, flush: Callable[[List[Any]], List[Any]],
+                 window_ms: float = 5.0, max_rows: int = 256):
+        self.app = app
+        self.flush = flush
+        self.window = window_ms / 1000.0
+        self.max_rows = max(1, max_rows)
+        self.pid = os.getpid()
+        self.batches = 0
+        self.rows = 0
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='group-commit-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        """False after stop() or in a forked child, where the thread does not exist"""
+        return self._thread.is_alive() and self.pid == os.getpid()
+
+    def submit(self, item: Any) -> Future:
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def stop(self, timeout: float = None):
+        """Flush what is queued and stop the thread"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _collect(self) -> Tuple[List[Tuple[Any, Future]], bool]:
+        """Block for the first item, then gather more until the window closes"""
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_rows:
+            remaining = deadline - time.monotonic()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            # Marks the rest as running, so they can no longer be cancelled
+            batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            items = [item for item, _ in batch]
+            try:
+                with self.app.app_context():
+                    results = self.flush(items)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
@@ -0,0 +1,197 @@
+import bisect
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+
+# Seconds; tuned for an API whose requests mostly finish in a few milliseconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{key}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram keyed by label values"""
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...], buckets: Iterable[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                # [per-bucket counts (+Inf last), sum, count]
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            snapshot = {key: ([*counts], total, count) for key, (counts, total, count) in self._series.items()}
+        for label_values, (counts, total, count) in sorted(snapshot.items()):
+            labels = dict(zip(self.label_names, label_values))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels({**labels, 'le': _format_value(float(bound))})
+                lines.append(f'{self.name}_bucket{bucket_labels} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(labels)} {count}')
+        return lines
+
+
+def _gauge(name: str, documentation: str, samples: Iterable[Tuple[Dict[str, str], float]], kind: str = 'gauge') -> List[str]:
+    lines = [f'# HELP {name} {documentation}', f'# TYPE {name} {kind}']
+    for labels, value in samples:
+        lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    return lines
+
+
+class RequestMetrics:
+    """Flask extension recording per-request wall time and SQL work
+
+    Each response gets a Server-Timing header (app, db). The same numbers
+    feed per-endpoint histograms, which /metrics exposes in Prometheus text
+    format together with connection pool and cache gauges.
+    """
+
+    def __init__(self, app: Flask = None, db=None):
+        self.request_duration = Histogram(
+            'ticketq_http_request_duration_seconds', 'Wall time spent handling a request',
+            ('endpoint', 'method', 'status'), LATENCY_BUCKETS
+        )
+        self.sql_statements = Histogram(
+            'ticketq_http_request_sql_statements', 'SQL statements executed per request',
+            ('endpoint',), STATEMENT_BUCKETS
+        )
+        self.sql_duration = Histogram(
+            'ticketq_http_request_sql_duration_seconds', 'Time spent in SQL per request',
+            ('endpoint',), LATENCY_BUCKETS
+        )
+        self._db = None
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app: Flask, db):
+        self._db = db
+        app.extensions['request_metrics'] = self
+        if not app.config.get('METRICS_ENABLED', True):
+            return
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+        app.add_url_rule('/metrics', 'metrics', self.metrics_view, methods=['GET'])
+
+    # Request hooks
+
+    def _before_request(self):
+        g.metrics_started = time.perf_counter()
+        g.metrics_sql_count = 0
+        g.metrics_sql_time = 0.0
+
+    def _after_request(self, response):
+        started = g.get('metrics_started')
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        sql_count = g.get('metrics_sql_count', 0)
+        sql_time = g.get('metrics_sql_time', 0.0)
+        endpoint = request.endpoint or 'unmatched'
+
+        response.headers['Server-Timing'] = (
+            f'app;dur={elapsed * 1000:.2f}, '
+            f'db;dur={sql_time * 1000:.2f};desc="{sql_count} queries"'
+        )
+        if endpoint != 'metrics':
+            self.request_duration.observe(elapsed, endpoint, request.method, str(response.status_code))
+            self.sql_statements.observe(sql_count, endpoint)
+            self.sql_duration.observe(sql_time, endpoint)
+        return response
+
+    # Engine hooks
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('metrics_query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        if has_request_context():
+            g.metrics_sql_count = g.get('metrics_sql_count', 0) + 1
+            g.metrics_sql_time = g.get('metrics_sql_time', 0.0) + elapsed
+
+    # Exposition
+
+    def _pool_samples(self):
+        samples = {'size': [], 'checked_out': [], 'checked_in': [], 'overflow': []}
+        for bind, engine in self._db.engines.items():
+            pool = engine.pool
+            labels = {'bind': bind or 'default', 'pool': type(pool).__name__}
+            # Only QueuePool-style pools expose these counters
+            for key, method in (('size', 'size'), ('checked_out', 'checkedout'),
+                                ('checked_in', 'checkedin'), ('overflow', 'overflow')):
+                if hasattr(pool, method):
+                    samples[key].append((labels, getattr(pool, method)()))
+        return samples
+
+    def render(self) -> str:
+        from flask import current_app
+
+        lines = []
+        for histogram in (self.request_duration, self.sql_statements, self.sql_duration):
+            lines.extend(histogram.render())
+
+        pool = self._pool_samples()
+        lines.extend(_gauge('ticketq_db_pool_size', 'Configured pool size', pool['size']))
+        lines.extend(_gauge('ticketq_db_pool_checked_out', 'Connections currently in use', pool['checked_out']))
+        lines.extend(_gauge('ticketq_db_pool_checked_in', 'Idle connections in the pool', pool['checked_in']))
+        lines.extend(_gauge('ticketq_db_pool_overflow', 'Connections opened beyond pool_size', pool['overflow']))
+
+        caches = []
+        for name in ('ticket_cache', 'ticket_count_cache', 'event_cache'):
+            cache = current_app.extensions.get(name)
+            if cache is not None:
+                caches.append(({'cache': name}, cache.stats()))
+        for counter in ('hits', 'misses', 'evictions', 'expirations'):
+            lines.extend(_gauge(f'ticketq_cache_{counter}_total', f'Cache {counter}',
+                                [(labels, stats[counter]) for labels, stats in caches], kind='counter'))
+        lines.extend(_gauge('ticketq_cache_entries', 'Entries currently cached',
+                            [(labels, stats['size']) for labels, stats in caches]))
+
+        return '\n'.join(lines) + '\n'
+
+    def metrics_view(self):
+        return Response(self.render(), mimetype='text/plain; version=0.0.4')
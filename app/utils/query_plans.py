@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional
+from sqlalchemy.sql import Select
+from app.utils.extensions import db
+
+
+def explain(statement: Select) -> List[str]:
+    """Return the backend's query plan for a statement, one line per plan step"""
+    engine = db.engine
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={'literal_binds': True}))
+
+    with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}').fetchall()
+            return [row[3] for row in rows]
+        rows = conn.exec_driver_sql(f'EXPLAIN {sql}').fetchall()
+        return [row[0] for row in rows]
+
+
+def _postgres_index_scans(plan: List[str], table: str) -> List[int]:
+    """Positions of PostgreSQL index scans on `table` that have no Index Cond
+
+    Such a scan reads the whole index, just like "SCAN ... USING INDEX" on
+    SQLite. The conditions of a node are the lines up to the next "->".
+    """
+    positions = []
+    for i, step in enumerate(plan):
+        if 'Index' not in step or 'Scan' not in step or f' on {table}' not in step:
+            continue
+        details = []
+        for line in plan[i + 1:]:
+            if '->' in line:
+                break
+            details.append(line)
+        if not any('Index Cond' in line for line in details):
+            positions.append(i)
+    return positions
+
+
+def plan_problems(plan: List[str], table: str = 'tickets', allow_sort: bool = False,
+                  ordered_index: Optional[str] = None) -> List[str]:
+    """Return the plan steps that scan the whole table or sort without an index
+
+    Only index searches count as index-backed; a scan is flagged even when it
+    walks an index, since it still visits every entry. allow_sort accepts a
+    sort step, for filtered queries where the index already narrows the rows
+    to be sorted. ordered_index accepts a scan of that one index, for
+    unfiltered listings that walk it in ORDER BY order and stop at the LIMIT.
+    """
+    problems = []
+    index_scans = _postgres_index_scans(plan, table)
+    for i, step in enumerate(plan):
+        # SQLite: any "SCAN tickets", with or without an index, or a temp sort
+        if step.startswith(f'SCAN {table}'):
+            if not (ordered_index and step == f'SCAN {table} USING INDEX {ordered_index}'):
+                problems.append(step)
+        elif 'USE TEMP B-TREE FOR ORDER BY' in step and not allow_sort:
+            problems.append(step)
+        # PostgreSQL
+        elif f'Seq Scan on {table}' in step:
+            problems.append(step)
+        elif i in index_scans and not (ordered_index and f' using {ordered_index} on {table}' in step):
+            problems.append(step)
+    return problems
+
+
+def check_statements(statements: Dict[str, Select], allow_sort: bool = False,
+                     ordered_scans: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, List[str]]]:
+    """Explain each named statement and collect any problem steps
+
+    ordered_scans maps statement names to the one tickets index each may
+    walk in full (see plan_problems).
+    """
+    ordered_scans = ordered_scans or {}
+    report = {}
+    for name, statement in statements.items():
+        plan = explain(statement)
+        # Ticket queries join events, so a full scan of either table counts
+        problems = plan_problems(plan, 'tickets', allow_sort, ordered_scans.get(name))
+        problems += [step for step in plan_problems(plan, 'events', allow_sort) if step not in problems]
+        report[name] = {'plan': plan, 'problems': problems}
+    return report
@@ -0,0 +1,128 @@
+"""Read-replica routing for GET requests
+
+When SQLALCHEMY_BINDS has a READ_REPLICA_BIND entry, GET/HEAD requests on
+the routes that opt in (tickets_bp) run their SELECTs on that engine.
+Everything else stays on the primary:
+
+- flushes and INSERT/UPDATE/DELETE statements, whatever the request;
+- requests from a client that wrote recently (read-your-writes cookie or
+  the X-Read-Your-Writes header);
+- all requests while the replica is failing its health check.
+
+A read that fails on the replica is retried on the primary, and the rest of
+that request stays there.
+"""
+
+import threading
+import time
+from flask import Flask, current_app, g, has_app_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, literal, select, table
+from sqlalchemy.exc import DBAPIError
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def reading_from_replica() -> bool:
+    """True while the current request sends its reads to the replica"""
+    return bool(has_app_context() and g.get('read_bind'))
+
+
+class RoutingSession(Session):
+    """Session that sends reads to g.read_bind when a request selected one"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        read_bind = g.get('read_bind') if has_app_context() else None
+        if read_bind and bind is None and not self._flushing and not getattr(clause, 'is_dml', False):
+            engine = self._db.engines.get(read_bind)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def execute(self, statement, *args, **kwargs):
+        """Execute a statement, retrying a failed replica read on the primary"""
+        if not reading_from_replica() or getattr(statement, 'is_dml', False):
+            return super().execute(statement, *args, **kwargs)
+        try:
+            return super().execute(statement, *args, **kwargs)
+        except DBAPIError:
+            # handle_error has already marked the replica down; the rollback
+            # releases the failed connection before the primary is used
+            g.pop('read_bind', None)
+            self.rollback()
+            return super().execute(statement, *args, **kwargs)
+
+
+class ReadReplica:
+    """Flask extension tracking replica health and read-your-writes windows"""
+
+    COOKIE_NAME = 'ticketq_rw'
+    HEADER_NAME = 'X-Read-Your-Writes'
+
+    def __init__(self, app: Flask = None, db=None, ping_table: str = 'tickets'):
+        self.ping_table = ping_table
+        self._db = db
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app: Flask, db):
+        self._db = db
+        bind = app.config.get('READ_REPLICA_BIND', 'replica')
+        if bind not in (app.config.get('SQLALCHEMY_BINDS') or {}):
+            return
+
+        state = {'bind': bind, 'up': True, 'checked_until': 0.0, 'lock': threading.Lock()}
+        app.extensions['read_replica'] = state
+        interval = app.config.get('READ_REPLICA_HEALTH_INTERVAL', 5)
+
+        def mark_down(context):
+            # Any error on the replica sends reads back to the primary until
+            # the next health check succeeds
+            state['up'] = False
+            state['checked_until'] = time.monotonic() + interval
+
+        with app.app_context():
+            event.listen(db.engines[bind], 'handle_error', mark_down)
+        # No models live on the replica bind; dropping its (empty) metadata
+        # keeps db.create_all()/drop_all() from ever connecting to it
+        db.metadatas.pop(bind, None)
+
+    def available(self) -> bool:
+        """Cached replica health, re-checked every READ_REPLICA_HEALTH_INTERVAL seconds"""
+        state = current_app.extensions['read_replica']
+        if time.monotonic() < state['checked_until']:
+            return state['up']
+        with state['lock']:
+            if time.monotonic() < state['checked_until']:
+                return state['up']
+            try:
+                with self._db.engines[state['bind']].connect() as conn:
+                    conn.execute(select(literal(1)).select_from(table(self.ping_table)).limit(1))
+                state['up'] = True
+            except Exception:
+                # handle_error has already marked the replica down
+                state['up'] = False
+            state['checked_until'] = time.monotonic() + current_app.config.get('READ_REPLICA_HEALTH_INTERVAL', 5)
+            return state['up']
+
+    def route_reads(self):
+        """before_request hook: pick the replica for eligible reads"""
+        state = current_app.extensions.get('read_replica')
+        if state is None or request.method not in SAFE_METHODS:
+            return None
+        if request.cookies.get(self.COOKIE_NAME) or request.headers.get(self.HEADER_NAME):
+            return None
+        if self.available():
+            g.read_bind = state['bind']
+        return None
+
+    def remember_writes(self, response):
+        """after_request hook: pin this client to the primary after a write"""
+        if (request.method not in SAFE_METHODS and response.status_code < 400
+                and 'read_replica' in current_app.extensions):
+            response.set_cookie(
+                self.COOKIE_NAME, '1',
+                max_age=current_app.config.get('READ_YOUR_WRITES_SECONDS', 5),
+                httponly=True, samesite='Lax'
+            )
+        return response
@@ -0,0 +1 @@
+"""Performance benchmarks for TicketQ (run with ``python -m benchmarks.<name>``)"""
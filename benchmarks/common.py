@@ -0,0 +1,104 @@
+"""Shared helpers for the benchmark scripts"""
+
+import math
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select
+from app import create_app
+from app.config import TestingConfig
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.services.event_stats_service import EventStatsService
+from app.utils.extensions import db
+
+
+def make_config(database_uri: str = None, **overrides):
+    """Build a TestingConfig subclass pointing at a throwaway database"""
+    if database_uri is None:
+        fd, path = tempfile.mkstemp(prefix='ticketq-bench-', suffix='.db')
+        os.close(fd)
+        database_uri = f'sqlite:///{path}'
+
+    attrs = {'SQLALCHEMY_DATABASE_URI': database_uri}
+    attrs.update(overrides)
+    return type('BenchmarkConfig', (TestingConfig,), attrs)
+
+
+def make_app(config_class=None, fresh: bool = True):
+    """Create an app and return it with its context pushed
+
+    With fresh=True all tables are dropped and recreated; otherwise missing
+    tables are created and existing data is kept.
+    """
+    app = create_app(config_class or make_config())
+    ctx = app.app_context()
+    ctx.push()
+    if fresh:
+        db.drop_all()
+    db.create_all()
+    return app
+
+
+def seed_tickets(count: int, chunk_size: int = 10000, events: int = 50):
+    """Insert `count` synthetic tickets with executemany in large chunks"""
+    base = datetime.now()
+    event_time = base + timedelta(days=30)
+
+    def event_key(i):
+        return f'Event {i % events}', f'Venue {i % 7}', event_time + timedelta(hours=i % events)
+
+    # Keys repeat every lcm(events, 7) tickets
+    keys = list(dict.fromkeys(event_key(i) for i in range(min(count, math.lcm(events, 7)))))
+    db.session.execute(insert(Event), [
+        {'name': name, 'location': location, 'time': time} for name, location, time in keys
+    ])
+    event_ids = {
+        (name, location, time): event_id
+        for event_id, name, location, time in db.session.execute(
+            select(Event.id, Event.name, Event.location, Event.time)
+        )
+    }
+    for start in range(0, count, chunk_size):
+        rows = [
+            {
+                'event_id': event_ids[event_key(i)],
+                'is_used': i % 5 == 0,
+                'created_at': base + timedelta(microseconds=i),
+                'updated_at': base + timedelta(microseconds=i)
+            }
+            for i in range(start, min(start + chunk_size, count))
+        ]
+        db.session.execute(insert(Ticket), rows)
+    db.session.commit()
+    # Raw inserts bypass TicketService, so derive the counters afterwards
+    EventStatsService.rebuild()
+
+
+def time_calls(func, repeat: int):
+    """Call `func` `repeat` times and return per-call latencies in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    """p50/p95/p99/mean of latency samples in milliseconds"""
+    return {
+        'p50_ms': round(percentile(samples, 50), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+        'p99_ms': round(percentile(samples, 99), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'samples': len(samples)
+    }
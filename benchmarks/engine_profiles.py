@@ -0,0 +1,85 @@
+"""Concurrent-write throughput of the SQLite engine profiles
+
+Each worker thread creates tickets one commit at a time through
+TicketService.create_ticket, like independent POST /tickets requests.
+
+Usage:
+    python -m benchmarks.engine_profiles [--threads 8] [--writes 200]
+"""
+
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from app.services.ticket_service import TicketService
+from app.utils.extensions import db
+from benchmarks.common import make_app, make_config, summarize
+
+
+def run_profile(profile: str, threads: int, writes: int):
+    app = make_app(make_config(DB_ENGINE_PROFILE=profile, TICKET_CACHE_SIZE=0))
+    # Make sure the journal mode of the file matches the profile under test
+    with db.engine.connect() as conn:
+        mode = conn.exec_driver_sql('PRAGMA journal_mode').scalar()
+    db.session.remove()
+
+    payload = {
+        'eventName': 'Benchmark Event',
+        'location': 'Benchmark Hall',
+        'time': datetime.now() + timedelta(days=30)
+    }
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        with app.app_context():
+            barrier.wait()
+            for _ in range(writes):
+                start = time.perf_counter()
+                try:
+                    TicketService.create_ticket(payload)
+                except Exception as e:
+                    with lock:
+                        errors.append(str(e))
+                    continue
+                with lock:
+                    latencies.append((time.perf_counter() - start) * 1000)
+            db.session.remove()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'journal_mode': mode,
+        'committed': len(latencies),
+        'errors': len(errors),
+        'seconds': round(elapsed, 3),
+        'writes_per_second': round(len(latencies) / elapsed, 1),
+        'latency': summarize(latencies) if latencies else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=200, help='writes per thread')
+    args = parser.parse_args()
+
+    results = {
+        profile: run_profile(profile, args.threads, args.writes)
+        for profile in ('default', 'sqlite')
+    }
+    print(json.dumps({'threads': args.threads, 'writes_per_thread': args.writes,
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
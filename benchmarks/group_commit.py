@@ -0,0 +1,100 @@
+"""Throughput/latency trade-off of group commit for single creates
+
+Worker threads call TicketService.create_ticket one ticket at a time, like
+independent POST /tickets requests, first with group commit off and then
+with each commit window. Larger windows mean fewer, bigger transactions
+(higher throughput) but each create waits longer for its batch.
+
+Usage:
+    python -m benchmarks.group_commit [--threads 16] [--writes 100]
+        [--windows 1,5,20] [--max-rows 256] [--synchronous NORMAL]
+"""
+
+import argparse
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from app.services.ticket_service import TicketService
+from app.utils.extensions import db
+from benchmarks.common import make_app, make_config, summarize
+
+
+def run(threads: int, writes: int, synchronous: str, window_ms: float = None, max_rows: int = 256):
+    overrides = {'SQLITE_SYNCHRONOUS': synchronous, 'TICKET_CACHE_SIZE': 0}
+    if window_ms is not None:
+        overrides.update(TICKET_GROUP_COMMIT=True, TICKET_GROUP_COMMIT_WINDOW_MS=window_ms,
+                         TICKET_GROUP_COMMIT_MAX_ROWS=max_rows)
+    app = make_app(make_config(**overrides))
+    db.session.remove()
+
+    payload = {
+        'eventName': 'Benchmark Event',
+        'location': 'Benchmark Hall',
+        'time': datetime.now() + timedelta(days=30)
+    }
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        with app.app_context():
+            barrier.wait()
+            for _ in range(writes):
+                start = time.perf_counter()
+                try:
+                    TicketService.create_ticket(payload)
+                except Exception as e:
+                    with lock:
+                        errors.append(str(e))
+                    continue
+                finally:
+                    db.session.remove()
+                with lock:
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    result = {
+        'committed': len(latencies),
+        'errors': len(errors),
+        'seconds': round(elapsed, 3),
+        'writes_per_second': round(len(latencies) / elapsed, 1),
+        'latency': summarize(latencies) if latencies else None
+    }
+    writer = app.extensions.get('ticket_group_commit')
+    if writer is not None:
+        writer.stop()
+        result['transactions'] = writer.batches
+        result['mean_batch_size'] = round(writer.rows / max(writer.batches, 1), 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--writes', type=int, default=100, help='writes per thread')
+    parser.add_argument('--windows', default='1,5,20', help='commit windows in ms')
+    parser.add_argument('--max-rows', type=int, default=256)
+    parser.add_argument('--synchronous', default='NORMAL',
+                        help='SQLite synchronous level; FULL fsyncs every commit')
+    args = parser.parse_args()
+
+    results = {'off': run(args.threads, args.writes, args.synchronous)}
+    for window in (float(w) for w in args.windows.split(',')):
+        results[f'window_{window:g}ms'] = run(args.threads, args.writes, args.synchronous,
+                                              window_ms=window, max_rows=args.max_rows)
+    print(json.dumps({'threads': args.threads, 'writes_per_thread': args.writes,
+                      'synchronous': args.synchronous, 'max_rows': args.max_rows,
+                      'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""In-process HTTP benchmark suite for the tickets and events blueprints
+
+Seeds a dataset, then drives every route registered on ``tickets_bp`` and
+``events_bp`` through the Flask test client at the requested concurrency. It reports
+latency percentiles, throughput and SQL statements per request as JSON.
+
+Usage:
+    python -m benchmarks.http_suite [--dataset 10k|1m|10m] [--concurrency 8]
+                                    [--requests 500] [--routes get_tickets,get_ticket]
+                                    [--database PATH] [--output results.json]
+
+Seeding 1m/10m rows takes a while; pass --database to keep the seeded file
+and reuse it on the next run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import event, func, select
+from app.models.ticket import Ticket
+from app.utils.cursor import encode_sync_token
+from app.utils.extensions import db
+from benchmarks.common import make_app, make_config, seed_tickets, summarize
+
+DATASETS = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+
+FUTURE = (datetime.now() + timedelta(days=60)).replace(microsecond=0).isoformat()
+NEW_TICKET = {'eventName': 'Benchmark Event', 'location': 'Benchmark Hall', 'time': FUTURE}
+
+
+def build_scenarios(max_id: int):
+    """Request factories keyed by blueprint endpoint name
+
+    Each factory takes a random.Random and returns (method, url, json_body).
+    Writing routes work on disjoint ID ranges so they do not starve each
+    other: PATCH uses the first quarter, redeem the second, delete the
+    upper half.
+    """
+    quarter = max(max_id // 4, 1)
+    half = max(max_id // 2, 2)
+    return {
+        'tickets.get_tickets': lambda rnd: ('GET', f'/tickets?page={rnd.randint(1, 50)}&per_page=100', None),
+        'tickets.get_ticket': lambda rnd: ('GET', f'/tickets/{rnd.randint(1, max_id)}', None),
+        'tickets.create_ticket': lambda rnd: ('POST', '/tickets', NEW_TICKET),
+        'tickets.create_tickets_batch': lambda rnd: ('POST', '/tickets/batch', [NEW_TICKET] * 100),
+        'tickets.update_ticket': lambda rnd: ('PATCH', f'/tickets/{rnd.randint(1, quarter)}', {'isUsed': True}),
+        'tickets.redeem_tickets': lambda rnd: (
+            'POST', '/tickets/redeem', {'ids': [rnd.randint(quarter + 1, half) for _ in range(100)]}
+        ),
+        'tickets.delete_ticket': lambda rnd: ('DELETE', f'/tickets/{rnd.randint(half + 1, max_id)}', None),
+        'events.get_event_stats': lambda rnd: ('GET', f'/events/Event {rnd.randint(0, 49)}/stats', None),
+        'tickets.search_tickets': lambda rnd: ('GET', f'/tickets/search?q=event {rnd.randint(0, 49)}', None),
+        # One delta-sync page for a client that is up to 1000 tickets behind
+        'tickets.get_ticket_changes': lambda rnd: (
+            'GET', f'/tickets/changes?since={encode_sync_token(0, max(max_id - rnd.randint(1, 1000), 0), 0)}', None
+        ),
+        'tickets.export_tickets': lambda rnd: (
+            'GET', f'/tickets/export?event_name=Event%20{rnd.randint(0, 49)}&time_to={FUTURE}', None
+        ),
+    }
+
+
+class QueryCounter:
+    """Counts SQL statements per thread via a cursor-execute hook"""
+
+    def __init__(self, engine):
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    def reset(self):
+        self._local.count = 0
+
+    @property
+    def count(self) -> int:
+        return getattr(self._local, 'count', 0)
+
+
+def run_route(app, counter, endpoint, factory, concurrency, total_requests, seed):
+    latencies = []
+    query_counts = []
+    statuses = {}
+    lock = threading.Lock()
+    per_worker = max(total_requests // concurrency, 1)
+
+    def worker(worker_id):
+        rnd = random.Random(seed + worker_id)
+        client = app.test_client()
+        for _ in range(per_worker):
+            method, url, body = factory(rnd)
+            counter.reset()
+            start = time.perf_counter()
+            response = client.open(url, method=method, json=body)
+            # Drain streamed bodies so their queries are counted
+            response.get_data()
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed)
+                query_counts.append(counter.count)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    wall = time.perf_counter() - started
+
+    return {
+        'endpoint': endpoint,
+        'requests': len(latencies),
+        'status_codes': {str(code): count for code, count in sorted(statuses.items())},
+        'throughput_rps': round(len(latencies) / wall, 1),
+        'latency': summarize(latencies),
+        'queries_per_request': {
+            'mean': round(sum(query_counts) / len(query_counts), 2),
+            'max': max(query_counts)
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--dataset', choices=sorted(DATASETS), default='10k')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=400, help='requests per route')
+    parser.add_argument('--routes', help='comma-separated endpoint names (default: all)')
+    parser.add_argument('--database', help='SQLite file to seed or reuse')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args()
+
+    uri = f'sqlite:///{os.path.abspath(args.database)}' if args.database else None
+    app = make_app(make_config(uri), fresh=not args.database)
+
+    rows = DATASETS[args.dataset]
+    existing = db.session.execute(select(func.count()).select_from(Ticket)).scalar_one()
+    seed_started = time.perf_counter()
+    if existing < rows:
+        seed_tickets(rows - existing)
+    seed_seconds = round(time.perf_counter() - seed_started, 1)
+    max_id = db.session.execute(select(func.max(Ticket.id))).scalar_one()
+    db.session.remove()
+
+    scenarios = build_scenarios(max_id)
+    endpoints = [
+        rule.endpoint for rule in app.url_map.iter_rules()
+        if rule.endpoint.startswith(('tickets.', 'events.'))
+    ]
+    missing = sorted(set(endpoints) - set(scenarios))
+    if missing:
+        print(f'warning: no scenario for {", ".join(missing)}', file=sys.stderr)
+
+    selected = [name if '.' in name else f'tickets.{name}'
+                for name in args.routes.split(',')] if args.routes else endpoints
+    # Read-only routes first, so destructive ones do not skew them
+    selected = sorted(dict.fromkeys(e for e in selected if e in scenarios),
+                      key=lambda e: e.split('.')[1].startswith(('create', 'update', 'redeem', 'delete')))
+
+    counter = QueryCounter(db.engine)
+    results = [
+        run_route(app, counter, endpoint, scenarios[endpoint], args.concurrency, args.requests, args.seed)
+        for endpoint in selected
+    ]
+
+    report = {
+        'dataset': args.dataset,
+        'rows': rows,
+        'seed_seconds': seed_seconds,
+        'concurrency': args.concurrency,
+        'requests_per_route': args.requests,
+        'python': platform.python_version(),
+        'database': app.config['SQLALCHEMY_DATABASE_URI'],
+        'engine_profile': app.config.get('DB_ENGINE_PROFILE_ACTIVE'),
+        'results': results
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare the ORM list path with the Core projection path at per_page=100
+
+Usage:
+    python -m benchmarks.list_projection [--rows 20000] [--per-page 100] [--repeat 300]
+"""
+
+import argparse
+import json
+from app.models.ticket import Ticket
+from app.services.ticket_service import TicketService
+from app.utils.extensions import db
+from benchmarks.common import make_app, make_config, seed_tickets, summarize, time_calls
+
+
+def orm_path(page: int, per_page: int):
+    """The previous list implementation: paginate() + Ticket.to_dict()"""
+    pagination = Ticket.query.order_by(Ticket.created_at.desc()).paginate(
+        page=page, per_page=per_page, error_out=False
+    )
+    return [ticket.to_dict() for ticket in pagination.items]
+
+
+def projection_path(page: int, per_page: int):
+    return TicketService.get_ticket_page(page=page, per_page=per_page)['items']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--page', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=300)
+    args = parser.parse_args()
+
+    # Count caching is disabled so both paths pay for the same COUNT(*)
+    make_app(make_config(TICKET_COUNT_CACHE_SIZE=0))
+    seed_tickets(args.rows)
+
+    assert orm_path(args.page, args.per_page) == projection_path(args.page, args.per_page)
+
+    results = {}
+    for name, func in (('orm', orm_path), ('projection', projection_path)):
+        def request_like():
+            func(args.page, args.per_page)
+            # Drop the session and identity map like a request teardown would
+            db.session.remove()
+
+        # Warm up statement caches before measuring
+        time_calls(request_like, 20)
+        results[name] = summarize(time_calls(request_like, args.repeat))
+
+    results['speedup_p50'] = round(results['orm']['p50_ms'] / results['projection']['p50_ms'], 2)
+    print(json.dumps({'rows': args.rows, 'per_page': args.per_page, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
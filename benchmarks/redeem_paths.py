@@ -0,0 +1,137 @@
+"""Cost of each redeem outcome, including writes to the change-feed counter
+
+Worker threads call TicketService.redeem_ticket / redeem_tickets like
+concurrent gate scanners. Each scenario reports latency, SQL statements per
+call and how many of those wrote the single ticket_sync_state row, which
+every writer has to lock.
+
+Usage:
+    python -m benchmarks.redeem_paths [--rows 20000] [--threads 8] [--calls 2000]
+"""
+
+import argparse
+import json
+import threading
+import time
+from sqlalchemy import event, func, select
+from app.models.ticket import Ticket
+from app.services.ticket_service import TicketService
+from app.utils.extensions import db
+from benchmarks.common import make_app, make_config, seed_tickets, summarize
+
+
+class StatementCounter:
+    """Counts statements, and UPDATEs of ticket_sync_state, per thread"""
+
+    def __init__(self, engine):
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.statements = getattr(self._local, 'statements', 0) + 1
+        if statement.startswith('UPDATE ticket_sync_state'):
+            self._local.counter_writes = getattr(self._local, 'counter_writes', 0) + 1
+
+    def take(self):
+        counts = getattr(self._local, 'statements', 0), getattr(self._local, 'counter_writes', 0)
+        self._local.statements = self._local.counter_writes = 0
+        return counts
+
+
+def run(app, counter, name, calls, threads, call):
+    """Run call(worker, i) `calls` times spread over `threads` threads"""
+    latencies = []
+    statements = []
+    counter_writes = []
+    outcomes = {}
+    lock = threading.Lock()
+    per_thread = max(calls // threads, 1)
+    barrier = threading.Barrier(threads)
+
+    def worker(worker_id):
+        with app.app_context():
+            barrier.wait()
+            counter.take()
+            for i in range(per_thread):
+                start = time.perf_counter()
+                outcome = call(worker_id, i)
+                elapsed = (time.perf_counter() - start) * 1000
+                n_statements, n_counter = counter.take()
+                with lock:
+                    latencies.append(elapsed)
+                    statements.append(n_statements)
+                    counter_writes.append(n_counter)
+                    outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                db.session.remove()
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    return {
+        'scenario': name,
+        'calls': len(latencies),
+        'outcomes': outcomes,
+        'calls_per_second': round(len(latencies) / wall, 1),
+        'latency': summarize(latencies),
+        'statements_per_call': round(sum(statements) / len(statements), 2),
+        'counter_writes_per_call': round(sum(counter_writes) / len(counter_writes), 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--calls', type=int, default=2000, help='calls per scenario')
+    args = parser.parse_args()
+
+    app = make_app(make_config(TICKET_CACHE_SIZE=0))
+    seed_tickets(args.rows)
+    unused = db.session.execute(
+        select(Ticket.id).where(Ticket.is_used == False).order_by(Ticket.id)  # noqa: E712
+    ).scalars().all()
+    used = db.session.execute(
+        select(Ticket.id).where(Ticket.is_used == True).order_by(Ticket.id)  # noqa: E712
+    ).scalars().all()
+    missing = db.session.execute(select(func.max(Ticket.id))).scalar_one() + 1
+    db.session.remove()
+
+    per_thread = max(args.calls // args.threads, 1)
+    if len(unused) < per_thread * args.threads:
+        parser.error('--rows is too small for --calls: not enough unused tickets')
+    counter = StatementCounter(db.engine)
+
+    def fresh(worker, i):
+        # Disjoint slices, so every call redeems a different unused ticket
+        return TicketService.redeem_ticket(unused[worker * per_thread + i])[0]
+
+    def scanned_twice(worker, i):
+        return TicketService.redeem_ticket(used[(worker * per_thread + i) % len(used)])[0]
+
+    def unknown(worker, i):
+        return TicketService.redeem_ticket(missing + worker * per_thread + i)[0]
+
+    def batch_replayed(worker, i):
+        start = (worker * per_thread + i) * 100 % len(used)
+        outcomes = TicketService.redeem_tickets(used[start:start + 100])
+        return 'batch:' + ','.join(sorted(set(outcomes.values())))
+
+    results = [
+        run(app, counter, name, args.calls, args.threads, call)
+        for name, call in (
+            ('already_used (409)', scanned_twice),
+            ('not_found (404)', unknown),
+            ('batch of 100 already used', batch_replayed),
+            ('redeemed', fresh),
+        )
+    ]
+    print(json.dumps({'rows': args.rows, 'threads': args.threads, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Cold-start cost: import time and time to first request
+
+Each sample runs in a fresh interpreter so nothing is cached in-process.
+`python -X importtime` attributes the import cost to top-level packages,
+and a second script measures interpreter start to the first response of
+GET /health, with the Swagger docs enabled and disabled.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--top 10]
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from benchmarks.common import summarize
+
+FIRST_REQUEST_SCRIPT = """
+import json
+import time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().get('/health')
+assert response.status_code == 200, response.status_code
+done = time.perf_counter()
+print(json.dumps({'import': imported - started, 'create_app': created - imported,
+                  'first_request': done - created, 'total': done - started}))
+"""
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def _env(swagger_enabled: bool):
+    fd, path = tempfile.mkstemp(prefix='ticketq-bench-', suffix='.db')
+    os.close(fd)
+    env = dict(os.environ)
+    env['DATABASE_URL'] = f'sqlite:///{path}'
+    env['SWAGGER_ENABLED'] = '1' if swagger_enabled else '0'
+    return env
+
+
+def import_profile(top: int):
+    """Cumulative import cost of the top-level packages pulled in by `import app`"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        capture_output=True, text=True, check=True, env=_env(True)
+    )
+    lines = [IMPORTTIME_LINE.match(line) for line in result.stderr.splitlines()]
+    lines = [match for match in lines if match]
+    # Children are printed before their parent; walk back from the `app`
+    # line to the previous top-level import to get app's own subtree
+    end = max(i for i, match in enumerate(lines) if match.group(4) == 'app' and len(match.group(3)) == 1)
+    start = end
+    while start > 0 and len(lines[start - 1].group(3)) > 1:
+        start -= 1
+    packages = {}
+    for match in lines[start:end]:
+        if len(match.group(3)) == 3:
+            name = match.group(4)
+            packages[name] = packages.get(name, 0) + int(match.group(2))
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {name: round(us / 1000, 2) for name, us in ranked}
+
+
+def first_request(runs: int):
+    """Alternate Swagger on/off runs so machine noise hits both equally"""
+    results = {}
+    for _ in range(runs):
+        for swagger_enabled in (True, False):
+            result = subprocess.run(
+                [sys.executable, '-c', FIRST_REQUEST_SCRIPT],
+                capture_output=True, text=True, check=True, env=_env(swagger_enabled)
+            )
+            sample = json.loads(result.stdout.strip().splitlines()[-1])
+            phases = results.setdefault('swagger_enabled' if swagger_enabled else 'swagger_disabled', {})
+            for phase, seconds in sample.items():
+                phases.setdefault(phase, []).append(seconds * 1000)
+    return {
+        mode: {phase: summarize(values) for phase, values in phases.items()}
+        for mode, phases in results.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    report = {'import_ms_by_package': import_profile(args.top)}
+    report.update(first_request(args.runs))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""CPU cost of validating create/update bodies
+
+Compares the previous path (json.loads, then Model(**data) with Python
+field validators) against model_validate_json on the raw bytes, where
+parsing and every constraint run inside pydantic-core.
+
+Usage:
+    python -m benchmarks.validation [--iterations 50000]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from app.schemas.ticket_schemas import TicketCreateSchema, TicketUpdateSchema
+
+
+class LegacyTicketCreateSchema(BaseModel):
+    """TicketCreateSchema as it was before constraints moved into the core"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    eventName: str = Field(..., min_length=1, max_length=255)
+    location: str = Field(..., min_length=1, max_length=255)
+    time: datetime = Field(...)
+
+    @field_validator('eventName')
+    @classmethod
+    def validate_event_name(cls, v):
+        if not v or v.isspace():
+            raise ValueError('Event name is required and cannot be empty')
+        return v.strip()
+
+    @field_validator('location')
+    @classmethod
+    def validate_location(cls, v):
+        if not v or v.isspace():
+            raise ValueError('Location is required and cannot be empty')
+        return v.strip()
+
+    @field_validator('time')
+    @classmethod
+    def validate_time(cls, v):
+        if v < datetime.now():
+            raise ValueError('Event time cannot be in the past')
+        return v
+
+
+def cpu_per_call(fn, iterations: int) -> float:
+    """Microseconds of process CPU time per call"""
+    for _ in range(min(1000, iterations)):
+        fn()
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def compare(legacy, current, iterations: int):
+    legacy_us = cpu_per_call(legacy, iterations)
+    current_us = cpu_per_call(current, iterations)
+    return {
+        'legacy_us': round(legacy_us, 2),
+        'model_validate_json_us': round(current_us, 2),
+        'saved_us': round(legacy_us - current_us, 2),
+        'speedup': round(legacy_us / current_us, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=50000)
+    args = parser.parse_args()
+
+    create_body = json.dumps({
+        'eventName': '  Summer Music Festival  ',
+        'location': 'Central Park, New York',
+        'time': (datetime.now() + timedelta(days=30)).isoformat()
+    }).encode()
+    update_body = json.dumps({'isUsed': True}).encode()
+
+    report = {
+        'create': compare(
+            lambda: LegacyTicketCreateSchema(**json.loads(create_body)),
+            lambda: TicketCreateSchema.model_validate_json(create_body),
+            args.iterations
+        ),
+        'update': compare(
+            lambda: TicketUpdateSchema(**json.loads(update_body)),
+            lambda: TicketUpdateSchema.model_validate_json(update_body),
+            args.iterations
+        )
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
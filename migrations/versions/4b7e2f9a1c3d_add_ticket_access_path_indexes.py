@@ -0,0 +1,54 @@
+"""add ticket access path indexes
+
+Revision ID: 4b7e2f9a1c3d
+Revises: c01296945d27
+Create Date: 2026-10-16 23:50:02.118204
+
+Indexes are built with CREATE INDEX CONCURRENTLY on PostgreSQL so the
+tickets table stays writable while they build. CONCURRENTLY cannot run
+inside a transaction, hence the autocommit block. SQLite ignores the flag.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2f9a1c3d'
+down_revision = 'c01296945d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_created_at_id', 'tickets', ['created_at', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_tickets_event_name_time', 'tickets', ['event_name', 'time'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_tickets_time', 'tickets', ['time'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_tickets_unused_created_at', 'tickets', ['created_at', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+            sqlite_where=sa.text('is_used = 0'),
+            postgresql_where=sa.text('is_used = false')
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tickets_unused_created_at', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_time', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_event_name_time', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tickets_created_at_id', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,36 @@
+"""add tickets archive
+
+Revision ID: 7a2c5e9f1b84
+Revises: 3f6b9d2e8a41
+Create Date: 2026-10-17 11:20:47.918230
+
+Cold storage for tickets of past events, filled by `flask archive-tickets`.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2c5e9f1b84'
+down_revision = '3f6b9d2e8a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tickets_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('event_name', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('time', sa.DateTime(), nullable=False),
+    sa.Column('is_used', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('tickets_archive')
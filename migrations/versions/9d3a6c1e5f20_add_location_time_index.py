@@ -0,0 +1,31 @@
+"""add location time index
+
+Revision ID: 9d3a6c1e5f20
+Revises: 4b7e2f9a1c3d
+Create Date: 2026-10-17 09:12:40.551873
+
+Backs the location filter on GET /tickets. Built CONCURRENTLY on PostgreSQL.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3a6c1e5f20'
+down_revision = '4b7e2f9a1c3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_location_time', 'tickets', ['location', 'time'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tickets_location_time', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
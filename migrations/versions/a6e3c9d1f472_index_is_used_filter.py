@@ -0,0 +1,42 @@
+"""index is_used filter
+
+Revision ID: a6e3c9d1f472
+Revises: f2b9c4e7a015
+Create Date: 2026-10-17 16:05:48.210394
+
+Replaces the partial index on unused tickets with (is_used, created_at, id),
+which serves is_used=true as well as is_used=false with an index search.
+Built CONCURRENTLY on PostgreSQL.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6e3c9d1f472'
+down_revision = 'f2b9c4e7a015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_is_used_created_at', 'tickets', ['is_used', 'created_at', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index('ix_tickets_unused_created_at', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tickets_unused_created_at', 'tickets', ['created_at', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+            sqlite_where=sa.text('is_used = 0'),
+            postgresql_where=sa.text('is_used = false')
+        )
+        op.drop_index('ix_tickets_is_used_created_at', table_name='tickets',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,40 @@
+"""add event stats
+
+Revision ID: b5d1e7c3a962
+Revises: 7a2c5e9f1b84
+Create Date: 2026-10-17 12:41:09.227561
+
+Per-event ticket counters for GET /events/<event_name>/stats, seeded from
+the existing live and archived tickets.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d1e7c3a962'
+down_revision = '7a2c5e9f1b84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('event_stats',
+    sa.Column('event_name', sa.String(length=255), nullable=False),
+    sa.Column('total_tickets', sa.Integer(), nullable=False),
+    sa.Column('used_tickets', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('event_name')
+    )
+    op.execute(
+        "INSERT INTO event_stats (event_name, total_tickets, used_tickets, updated_at) "
+        "SELECT event_name, COUNT(*), SUM(CASE WHEN is_used THEN 1 ELSE 0 END), CURRENT_TIMESTAMP "
+        "FROM (SELECT event_name, is_used FROM tickets "
+        "UNION ALL SELECT event_name, is_used FROM tickets_archive) AS all_tickets "
+        "GROUP BY event_name"
+    )
+
+
+def downgrade():
+    op.drop_table('event_stats')
@@ -0,0 +1,54 @@
+"""autoincrement ticket ids
+
+Revision ID: c8d2f5a7e913
+Revises: a6e3c9d1f472
+Create Date: 2026-10-17 16:48:03.377120
+
+Without AUTOINCREMENT, SQLite gives a new row max(id) + 1, so deleting or
+archiving the newest ticket let the next one reuse its ID and shadow an
+archived ticket. The table is rebuilt with AUTOINCREMENT, and the counter
+starts above every ID ever handed out, archived or deleted. PostgreSQL IDs
+come from a sequence that never goes back, so nothing changes there.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2f5a7e913'
+down_revision = 'a6e3c9d1f472'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    with op.batch_alter_table('tickets', recreate='always',
+                              table_kwargs={'sqlite_autoincrement': True}):
+        pass
+
+    # The copy set the counter to max(tickets.id); IDs that only survive in
+    # the archive or as tombstones must not come back either
+    op.execute(
+        "UPDATE sqlite_sequence SET seq = MAX(seq, "
+        "(SELECT COALESCE(MAX(id), 0) FROM tickets_archive), "
+        "(SELECT COALESCE(MAX(ticket_id), 0) FROM ticket_tombstones)) "
+        "WHERE name = 'tickets'"
+    )
+    op.execute(
+        "INSERT INTO sqlite_sequence (name, seq) SELECT 'tickets', MAX("
+        "(SELECT COALESCE(MAX(id), 0) FROM tickets_archive), "
+        "(SELECT COALESCE(MAX(ticket_id), 0) FROM ticket_tombstones)) "
+        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'tickets')"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    with op.batch_alter_table('tickets', recreate='always',
+                              table_kwargs={'sqlite_autoincrement': False}):
+        pass
@@ -0,0 +1,218 @@
+"""move event fields to events
+
+Revision ID: d4a8f2c6e1b7
+Revises: b5d1e7c3a962
+Create Date: 2026-10-17 13:52:36.604518
+
+Creates one events row per distinct (event_name, location, time) found in
+tickets, points every ticket at its event through tickets.event_id, then
+drops the repeated columns and their indexes from tickets. The full-text
+search index moves from tickets to events. tickets_archive keeps its own
+copy of the event fields and is left alone.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8f2c6e1b7'
+down_revision = 'b5d1e7c3a962'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_TICKETS_SEARCH = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+        event_name, location,
+        content='tickets', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ai AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts(rowid, event_name, location)
+        VALUES (new.id, new.event_name, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ad AFTER DELETE ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, event_name, location)
+        VALUES ('delete', old.id, old.event_name, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_au AFTER UPDATE OF event_name, location ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, event_name, location)
+        VALUES ('delete', old.id, old.event_name, old.location);
+        INSERT INTO tickets_fts(rowid, event_name, location)
+        VALUES (new.id, new.event_name, new.location);
+    END
+    """,
+    "INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')",
+]
+
+SQLITE_TICKETS_SEARCH_DROP = [
+    'DROP TRIGGER IF EXISTS tickets_fts_au',
+    'DROP TRIGGER IF EXISTS tickets_fts_ad',
+    'DROP TRIGGER IF EXISTS tickets_fts_ai',
+    'DROP TABLE IF EXISTS tickets_fts',
+]
+
+SQLITE_EVENTS_SEARCH = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        name, location,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF name, location ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, name, location)
+        VALUES ('delete', old.id, old.name, old.location);
+        INSERT INTO events_fts(rowid, name, location)
+        VALUES (new.id, new.name, new.location);
+    END
+    """,
+    "INSERT INTO events_fts(events_fts) VALUES ('rebuild')",
+]
+
+SQLITE_EVENTS_SEARCH_DROP = [
+    'DROP TRIGGER IF EXISTS events_fts_au',
+    'DROP TRIGGER IF EXISTS events_fts_ad',
+    'DROP TRIGGER IF EXISTS events_fts_ai',
+    'DROP TABLE IF EXISTS events_fts',
+]
+
+POSTGRES_TICKETS_SEARCH = [
+    "CREATE INDEX IF NOT EXISTS ix_tickets_search ON tickets "
+    "USING GIN (to_tsvector('simple', event_name || ' ' || location))",
+]
+
+POSTGRES_TICKETS_SEARCH_DROP = ['DROP INDEX IF EXISTS ix_tickets_search']
+
+POSTGRES_EVENTS_SEARCH = [
+    "CREATE INDEX IF NOT EXISTS ix_events_search ON events "
+    "USING GIN (to_tsvector('simple', name || ' ' || location))",
+]
+
+POSTGRES_EVENTS_SEARCH_DROP = ['DROP INDEX IF EXISTS ix_events_search']
+
+
+def run(statements):
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    op.create_table('events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=False),
+    sa.Column('time', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name', 'location', 'time', name='uq_events_name_location_time')
+    )
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.create_index('ix_events_location_time', ['location', 'time'], unique=False)
+        batch_op.create_index('ix_events_name_time', ['name', 'time'], unique=False)
+        batch_op.create_index('ix_events_time', ['time'], unique=False)
+
+    # Deduplicate: one event per distinct triple, dated by its first ticket
+    op.execute(
+        'INSERT INTO events (name, location, time, created_at) '
+        'SELECT event_name, location, time, MIN(created_at) FROM tickets '
+        'GROUP BY event_name, location, time'
+    )
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('event_id', sa.Integer(), nullable=True))
+    op.execute(
+        'UPDATE tickets SET event_id = ('
+        'SELECT events.id FROM events WHERE events.name = tickets.event_name '
+        'AND events.location = tickets.location AND events.time = tickets.time)'
+    )
+
+    # The old search objects reference the columns about to be dropped
+    if dialect == 'sqlite':
+        run(SQLITE_TICKETS_SEARCH_DROP)
+    elif dialect == 'postgresql':
+        run(POSTGRES_TICKETS_SEARCH_DROP)
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.alter_column('event_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_tickets_event_id_events', 'events', ['event_id'], ['id'])
+        batch_op.drop_index('ix_tickets_time')
+        batch_op.drop_index('ix_tickets_location_time')
+        batch_op.drop_index('ix_tickets_event_name_time')
+        batch_op.create_index('ix_tickets_event_id_created_at', ['event_id', 'created_at', 'id'], unique=False)
+        batch_op.drop_column('time')
+        batch_op.drop_column('location')
+        batch_op.drop_column('event_name')
+
+    if dialect == 'sqlite':
+        run(SQLITE_EVENTS_SEARCH)
+    elif dialect == 'postgresql':
+        run(POSTGRES_EVENTS_SEARCH)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'sqlite':
+        run(SQLITE_EVENTS_SEARCH_DROP)
+    elif dialect == 'postgresql':
+        run(POSTGRES_EVENTS_SEARCH_DROP)
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('event_name', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('location', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('time', sa.DateTime(), nullable=True))
+    op.execute(
+        'UPDATE tickets SET '
+        'event_name = (SELECT events.name FROM events WHERE events.id = tickets.event_id), '
+        'location = (SELECT events.location FROM events WHERE events.id = tickets.event_id), '
+        'time = (SELECT events.time FROM events WHERE events.id = tickets.event_id)'
+    )
+
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.alter_column('event_name', existing_type=sa.String(length=255), nullable=False)
+        batch_op.alter_column('location', existing_type=sa.String(length=255), nullable=False)
+        batch_op.alter_column('time', existing_type=sa.DateTime(), nullable=False)
+        batch_op.drop_constraint('fk_tickets_event_id_events', type_='foreignkey')
+        batch_op.drop_index('ix_tickets_event_id_created_at')
+        batch_op.drop_column('event_id')
+        batch_op.create_index('ix_tickets_event_name_time', ['event_name', 'time'], unique=False)
+        batch_op.create_index('ix_tickets_location_time', ['location', 'time'], unique=False)
+        batch_op.create_index('ix_tickets_time', ['time'], unique=False)
+
+    if dialect == 'sqlite':
+        run(SQLITE_TICKETS_SEARCH)
+    elif dialect == 'postgresql':
+        run(POSTGRES_TICKETS_SEARCH)
+
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_index('ix_events_time')
+        batch_op.drop_index('ix_events_name_time')
+        batch_op.drop_index('ix_events_location_time')
+
+    op.drop_table('events')
@@ -0,0 +1,82 @@
+"""add ticket full text search
+
+Revision ID: e8f14b27a6c9
+Revises: 9d3a6c1e5f20
+Create Date: 2026-10-17 11:05:18.402216
+
+SQLite: external-content FTS5 table over event_name/location, kept in sync
+by triggers, then rebuilt from the existing rows.
+PostgreSQL: GIN index over a tsvector expression, built CONCURRENTLY.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8f14b27a6c9'
+down_revision = '9d3a6c1e5f20'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+        event_name, location,
+        content='tickets', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ai AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts(rowid, event_name, location)
+        VALUES (new.id, new.event_name, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_ad AFTER DELETE ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, event_name, location)
+        VALUES ('delete', old.id, old.event_name, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_au AFTER UPDATE OF event_name, location ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, event_name, location)
+        VALUES ('delete', old.id, old.event_name, old.location);
+        INSERT INTO tickets_fts(rowid, event_name, location)
+        VALUES (new.id, new.event_name, new.location);
+    END
+    """,
+    "INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    'DROP TRIGGER IF EXISTS tickets_fts_au',
+    'DROP TRIGGER IF EXISTS tickets_fts_ad',
+    'DROP TRIGGER IF EXISTS tickets_fts_ai',
+    'DROP TABLE IF EXISTS tickets_fts',
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_UPGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tickets_search ON tickets "
+                "USING GIN (to_tsvector('simple', event_name || ' ' || location))"
+            )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_DOWNGRADE:
+            op.execute(statement)
+    elif dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_tickets_search')
@@ -0,0 +1,59 @@
+"""add ticket change feed
+
+Revision ID: f2b9c4e7a015
+Revises: d4a8f2c6e1b7
+Create Date: 2026-10-17 14:37:12.851903
+
+Sequence numbers and tombstones behind GET /tickets/changes. Existing
+tickets start at change_seq 0, so the first full sync lists all of them.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b9c4e7a015'
+down_revision = 'd4a8f2c6e1b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    sync_state = op.create_table('ticket_sync_state',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), nullable=False),
+    sa.Column('tombstone_floor', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(sync_state, [{'id': 1, 'change_seq': 0, 'tombstone_floor': 0}])
+
+    op.create_table('ticket_tombstones',
+    sa.Column('ticket_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('ticket_id')
+    )
+    with op.batch_alter_table('ticket_tombstones', schema=None) as batch_op:
+        batch_op.create_index('ix_ticket_tombstones_change_seq', ['change_seq', 'ticket_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_ticket_tombstones_deleted_at'), ['deleted_at'], unique=False)
+
+    # The server default only fills existing rows; it is dropped afterwards
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.alter_column('change_seq', existing_type=sa.BigInteger(), server_default=None)
+        batch_op.create_index('ix_tickets_change_seq_id', ['change_seq', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tickets', schema=None) as batch_op:
+        batch_op.drop_index('ix_tickets_change_seq_id')
+        batch_op.drop_column('change_seq')
+
+    with op.batch_alter_table('ticket_tombstones', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ticket_tombstones_deleted_at'))
+        batch_op.drop_index('ix_ticket_tombstones_change_seq')
+
+    op.drop_table('ticket_tombstones')
+    op.drop_table('ticket_sync_state')